@@ -24,26 +24,3 @@ __all__ = [
     "SUPPORTED_INDICES",
     "create_output_folder",
 ]
-
-# Validate imports
-def _validate_imports():
-    """
-    Validates all essential imports for the library.
-
-    Returns:
-        None
-    """
-    try:
-        # Check if all required classes and functions are imported
-        assert "SatelliteDataProcessor" in __all__
-        assert "SceneOperations" in __all__
-        assert "MetadataManager" in __all__
-        assert "DEFAULT_CRS" in __all__
-        assert "SUPPORTED_INDICES" in __all__
-        print("All necessary modules and functions are successfully imported.")
-    except AssertionError as e:
-        print(f"Validation failed: {e}")
-        raise ImportError("Critical modules or functions are missing in the package.")
-
-# Run validation on module load
-_validate_imports()
\ No newline at end of file
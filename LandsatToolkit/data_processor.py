@@ -1,10 +1,309 @@
 import os
-import rasterio
+import re
+import logging
+import logging.handlers
+import multiprocessing
 import numpy as np
-import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack
 from .scene_tools import SceneOperations
 from .metadata_tools import MetadataManager
-from .utils import create_output_folder
+from .utils import DEFAULT_RESAMPLING_METHOD, GDAL_READ_OPTIONS, GEOTIFF_PROFILE, INDEX_BANDS, SUPPORTED_INDICES, atomic_output, default_output_folder, geotiff_predictor
+
+logger = logging.getLogger(__name__)
+
+# Compiled band-selection patterns of `merge_bands`, keyed by the tuple of requested band suffixes
+_BAND_PATTERN_CACHE = {}
+
+# Per-scene workers
+"""
+Module-level functions processing a single scene. They run in worker processes,
+so they only take picklable arguments and build their own helper objects.
+"""
+
+def _init_worker_logging(queue, level):
+    """
+    Sends the package's log records from a worker process to the parent process through a queue.
+
+    Args:
+        queue (multiprocessing.Queue): Queue read by the parent process's `QueueListener`.
+        level (int): Logging level of the package in the parent process.
+
+    Returns:
+        None
+    """
+    package_logger = logging.getLogger(__package__)
+    package_logger.handlers[:] = [logging.handlers.QueueHandler(queue)]
+    package_logger.setLevel(level)
+    package_logger.propagate = False
+
+class _ForwardToLogger(logging.Handler):
+    """
+    Re-emits log records received from worker processes through the logger that created them.
+    """
+    def emit(self, record):
+        logging.getLogger(record.name).handle(record)
+
+def _is_up_to_date(output_file, input_files):
+    """
+    Checks whether an output file exists and is newer than all the inputs it was computed from.
+
+    Args:
+        output_file (str): Path of the output file.
+        input_files (iterable of str): Paths of the input files.
+
+    Returns:
+        bool: True if the output exists and no input was modified after it.
+    """
+    try:
+        output_mtime = os.stat(output_file).st_mtime_ns
+    except OSError:
+        return False
+    return all(os.stat(f).st_mtime_ns <= output_mtime for f in input_files)
+
+def _process_scene_indices(input_folder, scene, scene_files, band_index, satellite_type, indices, output_folder, L, quantize,
+                           tile_workers=1, skip_existing=False):
+    """
+    Calculates the requested indices for a single scene.
+
+    Args:
+        input_folder (str): Path to the input folder containing raw satellite data.
+        scene (str): Scene ID to process.
+        scene_files (list of str): File paths belonging to the scene.
+        band_index (dict): The scene's band suffixes (e.g., "SR_B4") mapped to file paths.
+        satellite_type (str): Satellite type of the scene (e.g., "landsat8"), or None if not recognized.
+        indices (list of str): Indices to calculate.
+        output_folder (str): Path where results will be saved.
+        L (float): Soil adjustment factor for SAVI.
+        quantize (bool): Whether indices are saved as scaled int16.
+        tile_workers (int): Number of threads reading and computing the scene's tiles, and compressing its outputs.
+        skip_existing (bool): Whether indices already saved and newer than their bands are skipped.
+
+    Returns:
+        None
+    """
+    logger.info("Processing scene: %s", scene)
+
+    try:
+        if satellite_type is None:
+            logger.warning("Satellite type not recognized for scene %s. Available files: %s", scene, scene_files)
+            return
+
+        scene_tools = SceneOperations(input_folder)
+
+        # Locate the band files; each index reads only the two bands it needs, so an index
+        # is skipped only if one of its own bands is missing
+        band_files = scene_tools.find_band_files(scene_files, satellite_type, band_index=band_index)
+        available = []
+        for index in indices:
+            missing = [band for band in INDEX_BANDS[index.upper()] if band not in band_files]
+            if missing:
+                logger.warning("%s band(s) required for %s not found for scene %s. Skipping %s...",
+                               ", ".join(band.upper() for band in missing), index, scene, index)
+            else:
+                available.append(index)
+        if not available:
+            return
+        indices = available
+
+        # Calculate all indices in one pass, reading each band once, and save results
+        scene_output_folder = os.path.join(output_folder, scene)
+        os.makedirs(scene_output_folder, exist_ok=True)
+        output_files = {index: os.path.join(scene_output_folder, f"{index}.tif") for index in indices}
+
+        if skip_existing:
+            for index, output_file in list(output_files.items()):
+                if _is_up_to_date(output_file, [band_files[band] for band in INDEX_BANDS[index.upper()]]):
+                    logger.info("%s for scene %s is up to date. Skipping...", index, scene)
+                    del output_files[index]
+            if not output_files:
+                return
+
+        scene_tools.calculate_and_save_indices(
+            band_files=band_files,
+            output_files=output_files,
+            satellite_type=satellite_type,
+            L=L,
+            quantize=quantize,
+            tile_workers=tile_workers,
+        )
+        logger.info("Saved %s for scene %s to %s", ", ".join(output_files), scene, scene_output_folder)
+
+    except FileNotFoundError as e:
+        logger.error("FileNotFoundError while processing scene %s: %s", scene, e)
+    except ValueError as e:
+        logger.error("ValueError while processing scene %s: %s", scene, e)
+    except Exception as e:
+        logger.error("Unexpected error while processing scene %s: %s", scene, e)
+
+def _extract_scene_metadata(input_folder, sid, scene_files, output_folder):
+    """
+    Extracts the metadata of a single scene into its own output subfolder.
+
+    Args:
+        input_folder (str): Path to the input folder containing raw satellite data.
+        sid (str): Scene ID to extract metadata for.
+        scene_files (list of str): File paths belonging to the scene.
+        output_folder (str): Path to the folder where metadata should be saved.
+
+    Returns:
+        None
+    """
+    # Define scene-specific output folder
+    scene_output_folder = os.path.join(output_folder, sid)
+    os.makedirs(scene_output_folder, exist_ok=True)
+
+    # Extract metadata using MetadataManager
+    try:
+        logger.info("Extracting metadata for scene: %s...", sid)
+        MetadataManager().extract_metadata(scene_output_folder, sid, input_folder, scene_files=scene_files)
+        logger.info("Metadata extracted and saved for scene: %s", sid)
+    except FileNotFoundError as e:
+        logger.error("FileNotFoundError while extracting metadata for scene '%s': %s", sid, e)
+    except PermissionError as e:
+        logger.error("PermissionError: Unable to save metadata for scene '%s': %s", sid, e)
+    except Exception as e:
+        logger.error("Unexpected error while extracting metadata for scene '%s': %s", sid, e)
+
+def _reproject_scene(input_folder, sid, scene_files, target_crs, output_folder, resampling, num_threads, warp_mem_limit):
+    """
+    Reprojects the raster files of a single scene into its own output subfolder.
+
+    Args:
+        input_folder (str): Path to the input folder containing raw satellite data.
+        sid (str): Scene ID to reproject.
+        scene_files (list of str): File paths belonging to the scene.
+        target_crs (str): Target CRS (e.g., "EPSG:32633").
+        output_folder (str): Path to the folder where reprojected files should be saved.
+        resampling (str or rasterio.enums.Resampling): Resampling method name or member.
+        num_threads (int): Number of threads GDAL uses for warping and compression.
+        warp_mem_limit (int): Working memory of the warp operation in MB.
+
+    Returns:
+        None
+    """
+    try:
+        logger.info("Reprojecting scene: %s...", sid)
+
+        # Create a folder for the reprojected files for the current scene
+        scene_output_folder = os.path.join(output_folder, sid)
+        os.makedirs(scene_output_folder, exist_ok=True)
+
+        # Reproject all raster files for the scene
+        SceneOperations(input_folder).reproject_scene(
+            scene_id=sid,
+            target_crs=target_crs,
+            output_folder=scene_output_folder,
+            resampling=resampling,
+            num_threads=num_threads,
+            warp_mem_limit=warp_mem_limit,
+            scene_files=scene_files,
+        )
+
+        logger.info("Reprojected files for scene %s saved to %s.", sid, scene_output_folder)
+
+    except FileNotFoundError as e:
+        logger.error("FileNotFoundError while reprojecting scene '%s': %s", sid, e)
+    except PermissionError as e:
+        logger.error("PermissionError: Unable to reproject files for scene '%s': %s", sid, e)
+    except Exception as e:
+        logger.error("Unexpected error while reprojecting scene '%s': %s", sid, e)
+
+def _merge_scene_bands(sid, scene_files, bands, output_folder, skip_existing=False, num_threads=1):
+    """
+    Merges the bands of a single scene into a single multi-band raster file.
+
+    Args:
+        sid (str): Scene ID to merge.
+        scene_files (list of str): File paths belonging to the scene.
+        bands (list of str): Band file suffixes to merge, or None to merge all bands.
+        output_folder (str): Path to the folder where the merged raster file should be saved.
+        skip_existing (bool): Whether the scene is skipped if its merged raster exists and is newer than its bands.
+        num_threads (int): Number of threads compressing the merged raster.
+
+    Returns:
+        None
+    """
+    import rasterio  # Imported on use, so importing the package does not load GDAL
+
+    logger.info("Merging bands for scene: %s", sid)
+
+    # Filter bands if specified
+    raster_files = [
+        f for f in scene_files if f.lower().endswith(('.tif', '.geotiff'))
+    ]  # Include only raster files
+
+    if bands:
+        key = tuple(bands)
+        pattern = _BAND_PATTERN_CACHE.get(key)
+        if pattern is None:
+            # Longest suffixes first, so "B10" is not matched as "B1"
+            pattern = re.compile("|".join(map(re.escape, sorted(key, key=len, reverse=True))))
+            _BAND_PATTERN_CACHE[key] = pattern
+
+        # Match each file name once, then keep the files in the order of the requested bands
+        band_order = {band: i for i, band in enumerate(key)}
+        matches = []
+        for f in raster_files:
+            match = pattern.search(os.path.basename(f))
+            if match:
+                matches.append((band_order[match.group(0)], f))
+        raster_files = [f for _, f in sorted(matches, key=lambda m: m[0])]
+
+    if not raster_files:
+        logger.warning("No valid bands found for scene %s. Skipping...", sid)
+        return
+
+    output_file = os.path.join(output_folder, f"{sid}_merged.tif")
+    if skip_existing and _is_up_to_date(output_file, raster_files):
+        logger.info("Merged raster for scene %s is up to date. Skipping...", sid)
+        return
+
+    try:
+        with ExitStack() as stack:
+            stack.enter_context(rasterio.Env(**GDAL_READ_OPTIONS))
+
+            # Open every band file once; all bands must share the first band's grid
+            sources = []
+            meta = None
+            for file_path in raster_files:
+                try:
+                    src = stack.enter_context(rasterio.open(file_path))
+                except rasterio.errors.RasterioIOError as e:
+                    logger.error("Error reading raster file %s: %s", file_path, e)
+                    continue
+                if meta is None:
+                    meta = src.meta.copy()
+                elif (src.height, src.width) != (meta["height"], meta["width"]):
+                    logger.error("Raster file %s does not match the size of the scene's other bands. Skipping...", file_path)
+                    continue
+                sources.append(src)
+
+            if not sources:
+                logger.warning("No valid data found in bands for scene %s. Skipping...", sid)
+                return
+
+            # Update meta for a tiled, compressed multi-band raster
+            meta.update(count=len(sources))
+            meta.update(GEOTIFF_PROFILE, predictor=geotiff_predictor(meta["dtype"]), num_threads=num_threads)
+
+            # Copy the bands one output tile at a time, reading every band's tile into one reused
+            # buffer and writing all bands of the tile at once; only a tile of each band is in memory.
+            # The tiles go to a temporary file, renamed to the output file once all are written
+            temp_file = stack.enter_context(atomic_output(output_file))
+            dst = stack.enter_context(rasterio.open(temp_file, "w", **meta))
+            tile_buffer = np.empty((len(sources), meta["blockysize"] * meta["blockxsize"]), dtype=meta["dtype"])
+            for _, window in dst.block_windows(1):
+                tiles = tile_buffer[:, :window.height * window.width].reshape(len(sources), window.height, window.width)
+                for tile, src in zip(tiles, sources):
+                    src.read(1, window=window, out=tile)  # Read the first band
+                dst.write(tiles, window=window)
+
+        logger.info("Merged raster saved to: %s", output_file)
+
+    except Exception as e:
+        logger.error("Error merging bands for scene %s: %s", sid, e)
+
 
 class SatelliteDataProcessor:
     """
@@ -33,15 +332,119 @@ class SatelliteDataProcessor:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize MetadataManager: {e}")
 
-        print(f"SatelliteDataProcessor initialized with input folder: {input_folder}")
+        # Per-scene band file indices and satellite types, and the scene grouping they were built from
+        self._scene_bands = {}
+        self._scene_satellite = {}
+        self._scene_index_source = None
+
+        # Sorted scene IDs shown by `show_scenes`, and the scene grouping they were sorted from
+        self._sorted_scene_ids = []
+        self._sorted_scenes_source = None
+
+        logger.info("SatelliteDataProcessor initialized with input folder: %s", input_folder)
+
+    def _scene_index(self, all_scenes):
+        """
+        Returns the band file index and satellite type of every scene.
+
+        Both are looked up once per scene grouping and reused until `group_files_by_scene`
+        returns a new grouping (i.e., the input folder changed).
+
+        Args:
+            all_scenes (dict): Scene IDs mapped to file paths, as returned by `group_files_by_scene`.
+
+        Returns:
+            tuple: Two dictionaries mapping scene IDs to the scene's band suffixes (e.g., "SR_B4")
+                   mapped to file paths, as returned by `index_band_files`, and to the satellite type.
+        """
+        if self._scene_index_source is not all_scenes:
+            self._scene_bands = {}
+            self._scene_satellite = {}
+            for sid, files in all_scenes.items():
+                band_index = self.scene_tools.index_band_files(files)
+                # All band files of a scene share its sensor code, so any of them gives the satellite type
+                band_file = next(iter(band_index.values()), None)
+                self._scene_bands[sid] = band_index
+                self._scene_satellite[sid] = self.scene_tools.detect_satellite_type(os.path.basename(band_file)) if band_file else None
+            self._scene_index_source = all_scenes
+        return self._scene_bands, self._scene_satellite
+
+    def _select_scenes(self, all_scenes, scene_id):
+        """
+        Looks up the requested scenes in the scene grouping, skipping those not in the input folder.
+
+        Args:
+            all_scenes (dict): Scene IDs mapped to file paths, as returned by `group_files_by_scene`.
+            scene_id (list of str): Requested scene IDs.
+
+        Returns:
+            dict: Requested scene IDs found in the input folder mapped to their file paths, in request order.
+        """
+        scenes = {}
+        for sid in scene_id:
+            files = all_scenes.get(sid)
+            if files is None:
+                logger.warning("Scene ID '%s' not found in input folder. Skipping...", sid)
+                continue
+            scenes[sid] = files
+        return scenes
+
+    def _run_scenes(self, worker, scene_args, max_workers=1):
+        """
+        Runs a per-scene worker function for several scenes, optionally in parallel worker processes.
+
+        Scenes are fully independent (separate inputs and output folders), so no
+        coordination between workers is needed. A single scene, or `max_workers=1`,
+        runs in the current process.
+
+        Args:
+            worker (callable): Module-level function processing a single scene.
+            scene_args (dict): Scene IDs mapped to tuples of positional arguments for `worker`.
+            max_workers (int, optional): Maximum number of worker processes. Defaults to 1; None uses the CPU count.
+
+        Returns:
+            None
+        """
+        if len(scene_args) <= 1 or max_workers == 1:
+            for args in scene_args.values():
+                worker(*args)
+            return
+
+        # Workers only enqueue their log records; this process writes them through its own handlers
+        log_queue = multiprocessing.Queue()
+        listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger())
+        listening = False
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_logging,
+                initargs=(log_queue, logging.getLogger(__package__).getEffectiveLevel()),
+            ) as executor:
+                # The first submission starts the worker processes (all of them when forking), so the
+                # listener thread is only started afterwards; records queue up until then
+                futures = {executor.submit(worker, *args): sid for sid, args in scene_args.items()}
+                listener.start()
+                listening = True
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.error("Unexpected error while processing scene '%s': %s", futures[future], e)
+        finally:
+            if listening:
+                listener.stop()
    
-    def organize_data(self, output_folder=None):
+    def organize_data(self, output_folder=None, max_workers=None, link_when_possible=True):
         """
         Organize satellite data into the specified output folder.
 
         Args:
             output_folder (str, optional): Path to the output folder for organized data.
                                         If None, a default timestamped folder is created.
+            max_workers (int, optional): Number of threads copying files concurrently.
+                                         Defaults to twice the CPU count, capped at 16.
+            link_when_possible (bool, optional): If True, files are hard-linked instead of copied when the
+                                                 input and output folders share a file system. Defaults to True.
 
         Returns:
             None
@@ -49,30 +452,31 @@ class SatelliteDataProcessor:
         try:
             # Handle default output folder
             if output_folder is None:
-                path = "output_organized_" + str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
-                output_folder = create_output_folder(path)
-                print(f"No output folder specified.\nUsing default: {output_folder}")
+                output_folder = default_output_folder("output_organized")
+                logger.info("No output folder specified.\nUsing default: %s", output_folder)
             else:
                 if not os.path.exists(output_folder):
                     os.makedirs(output_folder, exist_ok=True)
-                    print(f"Created specified output folder: {output_folder}")
+                    logger.info("Created specified output folder: %s", output_folder)
                 else:
-                    print(f"Using existing output folder: {output_folder}")
+                    logger.info("Using existing output folder: %s", output_folder)
             
-            print(f"Organizing satellite data into: {output_folder}")
+            logger.info("Organizing satellite data into: %s", output_folder)
             
             # Call the scene_tools method to organize the data
-            self.scene_tools.organize_satellite_data(output_folder)
-            print("Data organization complete.")
+            self.scene_tools.organize_satellite_data(output_folder, max_workers=max_workers,
+                                                     link_when_possible=link_when_possible)
+            logger.info("Data organization complete.")
         
         except PermissionError as e:
-            print(f"PermissionError: Unable to write to the specified output folder '{output_folder}'.\n{e}")
+            logger.error("PermissionError: Unable to write to the specified output folder '%s'.\n%s", output_folder, e)
         except FileNotFoundError as e:
-            print(f"FileNotFoundError: Input folder or files are missing.\n{e}")
+            logger.error("FileNotFoundError: Input folder or files are missing.\n%s", e)
         except Exception as e:
-            print(f"An unexpected error occurred during data organization: {e}")
+            logger.error("An unexpected error occurred during data organization: %s", e)
 
-    def indice_calculator(self, output_folder=None, indices=None, scene_id=None, L=None):
+    def indice_calculator(self, output_folder=None, indices=None, scene_id=None, L=None, quantize=False, max_workers=1,
+                          skip_existing=False):
         """
         Calculate indices for specific scenes and save to the specified output folder.
 
@@ -83,102 +487,90 @@ class SatelliteDataProcessor:
                                         will be calculated.
             scene_id (str or list of str): Scene ID(s) to process. If None, all scenes in
                                         the input folder will be processed.
+            L (float, optional): Soil adjustment factor for SAVI. Defaults to 0.5.
+            quantize (bool, optional): If True, indices are saved as int16 scaled by 10000
+                                       instead of float32, halving the output size.
+            max_workers (int, optional): Maximum number of scenes processed in parallel worker processes.
+                                         Defaults to 1 (scenes run one after another in this process);
+                                         None uses all CPUs. Scripts using more than one worker must run
+                                         under an `if __name__ == "__main__":` guard.
+            skip_existing (bool, optional): If True, indices already saved in the output folder and
+                                            newer than their band files are not recalculated. Default is False.
         """
         try:
             # Handle default output folder
             if output_folder is None:
-                path = "output_indices_" + str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
-                output_folder = create_output_folder(path)
-                print(f"No output folder specified.\nUsing default: {output_folder}")
+                output_folder = default_output_folder("output_indices")
+                logger.info("No output folder specified.\nUsing default: %s", output_folder)
             else:
                 if not os.path.exists(output_folder):
                     os.makedirs(output_folder, exist_ok=True)
-                    print(f"Created specified output folder: {output_folder}")
+                    logger.info("Created specified output folder: %s", output_folder)
                 else:
-                    print(f"Using existing output folder: {output_folder}")
+                    logger.info("Using existing output folder: %s", output_folder)
 
             # Handle default indices
             if indices is None:
                 indices = ["NDVI", "NDBI", "NDWI", "SAVI"]  # All supported indices
-                print("No indices specified. Calculating all supported indices.")
+                logger.info("No indices specified. Calculating all supported indices.")
             elif isinstance(indices, str):
                 indices = [indices]  # Convert a single string to a list
 
+            # Check the indices once, before any scene is processed: unsupported ones are
+            # skipped, so they do not stop the supported indices of every scene
+            unsupported = [index for index in indices if index.upper() not in SUPPORTED_INDICES]
+            for index in unsupported:
+                logger.error("Unsupported index type: %s. Skipping...", index)
+            indices = [index for index in indices if index.upper() in SUPPORTED_INDICES]
+            if not indices:
+                logger.error("No supported indices to calculate. Supported indices: %s", ", ".join(SUPPORTED_INDICES))
+                return
+
             # Group files by scene
             all_scenes = self.scene_tools.group_files_by_scene()
 
             # Handle default scenes
             if scene_id is None:
                 scene_id = list(all_scenes.keys())  # Process all scenes
-                print("No scene ID specified. Processing all scenes.")
+                logger.info("No scene ID specified. Processing all scenes.")
             elif isinstance(scene_id, str):
                 scene_id = [scene_id]  # Convert a single string to a list
 
             if L is None:
                 L = 0.5
-                print(f"No L value for SAVI specified. Using default value: {L}")
+                logger.info("No L value for SAVI specified. Using default value: %s", L)
             else:
                 L = float(L)
                 
-            # Process each scene
-            for scene in scene_id:
-                if scene not in all_scenes:
-                    print(f"Scene ID '{scene}' not found in input folder. Skipping...")
-                    continue
+            # Band files and satellite types are looked up once per scene grouping
+            scene_bands, scene_satellite = self._scene_index(all_scenes)
 
-                print(f"Processing scene: {scene}")
+            # Keep only the scenes present in the input folder
+            scenes = self._select_scenes(all_scenes, scene_id)
 
-                try:
-                    # Create band matrix for the scene
-                    matrix = self.scene_tools.create_band_matrices(scene)
-
-                    # Find the B4 file
-                    B4 = None
-                    for file in all_scenes[scene]:
-                        if "_SR_B4" in file.upper():
-                            B4 = file
-                            break
-
-                    # Check if B4 is found
-                    if not B4:
-                        print(f"B4 reference file not found for scene {scene}. Available files: {all_scenes[scene]}")
-                        continue  # Skip to the next scene
-
-                    # Detect satellite type
-                    satellite_type = self.scene_tools.detect_satellite_type(B4)
-
-                    # Calculate indices and save results
-                    for index in indices:
-                        scene_output_folder = os.path.join(output_folder, scene)
-                        os.makedirs(scene_output_folder, exist_ok=True)
-                        output_file = os.path.join(scene_output_folder, f"{index}.tif")
-
-                        # Use the updated calculate_and_save_index method
-                        self.scene_tools.calculate_and_save_index(
-                            band_matrix=matrix,
-                            index_type=index,
-                            satellite_type=satellite_type,
-                            output_file=output_file,
-                            B4=B4,
-                            L=L if index == "SAVI" else None  # Pass L only if the index is SAVI
-                        )
-                        print(f"Saved {index} for scene {scene} to {output_file}")
-
-                except FileNotFoundError as e:
-                    print(f"FileNotFoundError while processing scene {scene}: {e}")
-                except ValueError as e:
-                    print(f"ValueError while processing scene {scene}: {e}")
-                except Exception as e:
-                    print(f"Unexpected error while processing scene {scene}: {e}")
-
-            print("Index calculation complete.")
+            # Share the CPUs between the tile threads of the scenes running in parallel
+            parallel_scenes = 1 if max_workers == 1 else min(len(scenes), max_workers or os.cpu_count())
+            tile_workers = max(1, os.cpu_count() // max(1, parallel_scenes))
+
+            # Process each scene in parallel
+            scene_args = {
+                scene: (
+                    self.input_folder, scene, files, scene_bands[scene], scene_satellite[scene],
+                    indices, output_folder, L, quantize, tile_workers, skip_existing,
+                )
+                for scene, files in scenes.items()
+            }
+
+            self._run_scenes(_process_scene_indices, scene_args, max_workers)
+
+            logger.info("Index calculation complete.")
 
         except PermissionError as e:
-            print(f"PermissionError: Unable to write to the specified output folder '{output_folder}'.\n{e}")
+            logger.error("PermissionError: Unable to write to the specified output folder '%s'.\n%s", output_folder, e)
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
     
-    def extract_metadata(self, output_folder=None, scene_id=None):
+    def extract_metadata(self, output_folder=None, scene_id=None, max_workers=1):
         """
         Extract metadata for one or more scenes and save to the specified output folder.
 
@@ -187,64 +579,54 @@ class SatelliteDataProcessor:
                                         Defaults to a timestamped folder if not provided.
             scene_id (str or list of str, optional): Scene ID(s) to extract metadata for.
                                                     If not provided, all scenes in the input folder will be processed.
+            max_workers (int, optional): Maximum number of scenes processed in parallel worker processes.
+                                         Defaults to 1 (scenes run one after another in this process);
+                                         None uses all CPUs. Scripts using more than one worker must run
+                                         under an `if __name__ == "__main__":` guard.
         """
         try:
             # Handle default output folder
             if output_folder is None:
-                path = "output_metadata_" + str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
-                output_folder = create_output_folder(path)
-                print(f"No output folder specified.\nUsing default: {output_folder}")
+                output_folder = default_output_folder("output_metadata")
+                logger.info("No output folder specified.\nUsing default: %s", output_folder)
             else:
                 if not os.path.exists(output_folder):
                     os.makedirs(output_folder, exist_ok=True)
-                    print(f"Specified output folder created: {output_folder}")
+                    logger.info("Specified output folder created: %s", output_folder)
                 else:
-                    print(f"Using existing output folder: {output_folder}")
+                    logger.info("Using existing output folder: %s", output_folder)
 
             # Group files by scene
             try:
                 all_scenes = self.scene_tools.group_files_by_scene()  # Use SceneOperations to group files
             except Exception as e:
-                print(f"Error grouping files by scene: {e}")
+                logger.error("Error grouping files by scene: %s", e)
                 return
 
             # Handle default scenes
             if scene_id is None:
                 scene_id = list(all_scenes.keys())  # Process all scenes
-                print("No scene ID specified. Processing all scenes.")
+                logger.info("No scene ID specified. Processing all scenes.")
             elif isinstance(scene_id, str):
                 scene_id = [scene_id]  # Convert a single string to a list
 
-            # Process each scene
-            for sid in scene_id:
-                if sid not in all_scenes:
-                    print(f"Scene ID '{sid}' not found in input folder. Skipping...")
-                    continue
+            # Process each scene in parallel
+            scene_args = {
+                sid: (self.input_folder, sid, files, output_folder)
+                for sid, files in self._select_scenes(all_scenes, scene_id).items()
+            }
 
-                # Define scene-specific output folder
-                scene_output_folder = os.path.join(output_folder, sid)
-                os.makedirs(scene_output_folder, exist_ok=True)
+            self._run_scenes(_extract_scene_metadata, scene_args, max_workers)
 
-                # Extract metadata using MetadataManager
-                try:
-                    print(f"Extracting metadata for scene: {sid}...")
-                    self.metadata_tools.extract_metadata(scene_output_folder, sid, self.input_folder)
-                    print(f"Metadata extracted and saved for scene: {sid}")
-                except FileNotFoundError as e:
-                    print(f"FileNotFoundError while extracting metadata for scene '{sid}': {e}")
-                except PermissionError as e:
-                    print(f"PermissionError: Unable to save metadata for scene '{sid}': {e}")
-                except Exception as e:
-                    print(f"Unexpected error while extracting metadata for scene '{sid}': {e}")
-
-            print("Metadata extraction process complete.")
+            logger.info("Metadata extraction process complete.")
 
         except PermissionError as e:
-            print(f"PermissionError: Unable to create or write to the specified output folder '{output_folder}'.\n{e}")
+            logger.error("PermissionError: Unable to create or write to the specified output folder '%s'.\n%s", output_folder, e)
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
             
-    def reproject(self, output_folder=None, scene_id=None, target_crs=None):
+    def reproject(self, output_folder=None, scene_id=None, target_crs=None, max_workers=1,
+                  resampling=DEFAULT_RESAMPLING_METHOD, num_threads=None, warp_mem_limit=512):
         """
         Reprojects raster files in the specified scene(s) to the target CRS.
 
@@ -254,6 +636,17 @@ class SatelliteDataProcessor:
             scene_id (str or list of str, optional): Scene ID(s) to reproject. If None, all scenes in the input folder
                                                     will be reprojected.
             target_crs (str): Target CRS (e.g., "EPSG:32633").
+            max_workers (int, optional): Maximum number of scenes processed in parallel worker processes.
+                                         Defaults to 1 (scenes run one after another in this process);
+                                         None uses all CPUs. Scripts using more than one worker must run
+                                         under an `if __name__ == "__main__":` guard.
+            resampling (str or rasterio.enums.Resampling, optional): Resampling method for continuous bands, by
+                                        name (e.g., "nearest", "bilinear") or as a `Resampling` member (e.g.,
+                                        `Resampling.bilinear`). Bit flag QA bands are always resampled with
+                                        "nearest". Defaults to "bilinear".
+            num_threads (int, optional): Number of threads GDAL uses to warp and compress each scene. Defaults to
+                                         the number of CPUs divided among the scenes processed in parallel.
+            warp_mem_limit (int, optional): Working memory of the warp operation in MB. Defaults to 512.
 
         Returns:
             None
@@ -265,69 +658,54 @@ class SatelliteDataProcessor:
 
             # Handle default output folder
             if output_folder is None:
-                path = "output_reprojected_" + str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
-                output_folder = create_output_folder(path)
-                print(f"No output folder specified.\nUsing default: {output_folder}")
+                output_folder = default_output_folder("output_reprojected")
+                logger.info("No output folder specified.\nUsing default: %s", output_folder)
             else:
                 if not os.path.exists(output_folder):
                     os.makedirs(output_folder, exist_ok=True)
-                    print(f"Specified output folder created: {output_folder}")
+                    logger.info("Specified output folder created: %s", output_folder)
                 else:
-                    print(f"Using existing output folder: {output_folder}")
+                    logger.info("Using existing output folder: %s", output_folder)
 
             # Group files by scene
             try:
                 all_scenes = self.scene_tools.group_files_by_scene()
             except Exception as e:
-                print(f"Error grouping files by scene: {e}")
+                logger.error("Error grouping files by scene: %s", e)
                 return
 
             # Handle default scenes
             if scene_id is None:
                 scene_id = list(all_scenes.keys())  # Process all scenes
-                print("No scene ID specified. Reprojecting all scenes.")
+                logger.info("No scene ID specified. Reprojecting all scenes.")
             elif isinstance(scene_id, str):
                 scene_id = [scene_id]  # Convert a single string to a list
 
-            # Process each scene
-            for sid in scene_id:
-                if sid not in all_scenes:
-                    print(f"Scene ID '{sid}' not found in input folder. Skipping...")
-                    continue
+            # Keep only the scenes present in the input folder
+            scenes = self._select_scenes(all_scenes, scene_id)
 
-                try:
-                    print(f"Reprojecting scene: {sid}...")
-                    
-                    # Create a folder for the reprojected files for the current scene
-                    scene_output_folder = os.path.join(output_folder, sid)
-                    os.makedirs(scene_output_folder, exist_ok=True)
-
-                    # Reproject all raster files for the scene
-                    self.scene_tools.reproject_scene(
-                        scene_id=sid,
-                        target_crs=target_crs,
-                        output_folder=scene_output_folder
-                    )
+            # Share the CPUs between the warp threads of the scenes running in parallel
+            if num_threads is None:
+                parallel_scenes = 1 if max_workers == 1 else min(len(scenes), max_workers or os.cpu_count())
+                num_threads = max(1, os.cpu_count() // max(1, parallel_scenes))
 
-                    print(f"Reprojected files for scene {sid} saved to {scene_output_folder}.")
+            # Process each scene in parallel
+            scene_args = {
+                sid: (self.input_folder, sid, files, target_crs, output_folder, resampling, num_threads, warp_mem_limit)
+                for sid, files in scenes.items()
+            }
+            self._run_scenes(_reproject_scene, scene_args, max_workers)
 
-                except FileNotFoundError as e:
-                    print(f"FileNotFoundError while reprojecting scene '{sid}': {e}")
-                except PermissionError as e:
-                    print(f"PermissionError: Unable to reproject files for scene '{sid}': {e}")
-                except Exception as e:
-                    print(f"Unexpected error while reprojecting scene '{sid}': {e}")
-
-            print("Reprojection process complete.")
+            logger.info("Reprojection process complete.")
 
         except ValueError as e:
-            print(f"ValueError: {e}")
+            logger.error("ValueError: %s", e)
         except PermissionError as e:
-            print(f"PermissionError: Unable to create or write to the specified output folder '{output_folder}'.\n{e}")
+            logger.error("PermissionError: Unable to create or write to the specified output folder '%s'.\n%s", output_folder, e)
         except Exception as e:
-            print(f"An unexpected error occurred: {e}")
+            logger.error("An unexpected error occurred: %s", e)
                     
-    def merge_bands(self, output_folder=None, scene_id=None, bands=None):
+    def merge_bands(self, output_folder=None, scene_id=None, bands=None, max_workers=1, skip_existing=False):
         """
         Merge bands for one or more scenes into a single multi-band raster file.
 
@@ -337,6 +715,12 @@ class SatelliteDataProcessor:
             scene_id (str or list of str, optional): Scene ID(s) to process. If None, all scenes will be processed.
             bands (list of str, optional): List of band file suffixes to merge (e.g., ["_SR_B1", "_SR_B2"]).
                                         If None, all bands in the scene will be merged.
+            max_workers (int, optional): Maximum number of scenes processed in parallel worker processes.
+                                         Defaults to 1 (scenes run one after another in this process);
+                                         None uses all CPUs. Scripts using more than one worker must run
+                                         under an `if __name__ == "__main__":` guard.
+            skip_existing (bool, optional): If True, scenes whose merged raster already exists in the output
+                                            folder and is newer than their band files are skipped. Default is False.
 
         Returns:
             None
@@ -344,9 +728,8 @@ class SatelliteDataProcessor:
         try:
             # Handle default output folder
             if output_folder is None:
-                path = "output_merged_" + str(datetime.datetime.now().strftime("%Y%m%d_%H%M%S"))
-                output_folder = create_output_folder(path)
-                print(f"No output folder specified.\nUsing default: {output_folder}")
+                output_folder = default_output_folder("output_merged")
+                logger.info("No output folder specified.\nUsing default: %s", output_folder)
             else:
                 os.makedirs(output_folder, exist_ok=True)
 
@@ -354,79 +737,35 @@ class SatelliteDataProcessor:
             try:
                 all_scenes = self.scene_tools.group_files_by_scene()
             except Exception as e:
-                print(f"Error grouping files by scene: {e}")
+                logger.error("Error grouping files by scene: %s", e)
                 return
 
             # Handle default scenes
             if scene_id is None:
                 scene_id = list(all_scenes.keys())  # Process all scenes
-                print("No scene ID specified. Processing all scenes.")
+                logger.info("No scene ID specified. Processing all scenes.")
             elif isinstance(scene_id, str):
                 scene_id = [scene_id]  # Convert a single string to a list
 
-            # Process each scene
-            for sid in scene_id:
-                if sid not in all_scenes:
-                    print(f"Scene ID '{sid}' not found in input folder. Skipping...")
-                    continue
-
-                print(f"Merging bands for scene: {sid}")
-
-                # Filter bands if specified
-                scene_files = all_scenes[sid]
-                raster_files = [
-                    f for f in scene_files if f.lower().endswith(('.tif', '.geotiff'))
-                ]  # Include only raster files
-
-                if bands:
-                    filtered_files = []
-                    for band in bands:
-                        filtered_files.extend([f for f in raster_files if band in os.path.basename(f)])
-                    raster_files = filtered_files
-
-                if not raster_files:
-                    print(f"No valid bands found for scene {sid}. Skipping...")
-                    continue
-
-                try:
-                    # Read all bands and merge them
-                    band_data = []
-                    meta = None
-
-                    for file_path in raster_files:
-                        try:
-                            with rasterio.open(file_path) as src:
-                                if meta is None:
-                                    meta = src.meta.copy()
-                                    meta.update(count=len(raster_files))  # Update meta for multi-band raster
-
-                                band_data.append(src.read(1))  # Read the first band
-                        except rasterio.errors.RasterioIOError as e:
-                            print(f"Error reading raster file {file_path}: {e}")
-                            continue
-
-                    if not band_data:
-                        print(f"No valid data found in bands for scene {sid}. Skipping...")
-                        continue
-
-                    # Stack bands into a single array
-                    merged_array = np.stack(band_data, axis=0)
+            # Keep only the scenes present in the input folder
+            scenes = self._select_scenes(all_scenes, scene_id)
 
-                    # Create the output file
-                    output_file = os.path.join(output_folder, f"{sid}_merged.tif")
-                    with rasterio.open(output_file, "w", **meta) as dst:
-                        for i in range(merged_array.shape[0]):
-                            dst.write(merged_array[i], i + 1)
+            # Share the CPUs between the compression threads of the scenes running in parallel
+            parallel_scenes = 1 if max_workers == 1 else min(len(scenes), max_workers or os.cpu_count())
+            num_threads = max(1, os.cpu_count() // max(1, parallel_scenes))
 
-                    print(f"Merged raster saved to: {output_file}")
+            # Process each scene in parallel
+            scene_args = {
+                sid: (sid, files, bands, output_folder, skip_existing, num_threads)
+                for sid, files in scenes.items()
+            }
 
-                except Exception as e:
-                    print(f"Error merging bands for scene {sid}: {e}")
+            self._run_scenes(_merge_scene_bands, scene_args, max_workers)
 
-            print("Band merging process complete.")
+            logger.info("Band merging process complete.")
 
         except Exception as e:
-            print(f"An unexpected error occurred during band merging: {e}")
+            logger.error("An unexpected error occurred during band merging: %s", e)
             
     def show_scenes(self):
         """
@@ -446,9 +785,12 @@ class SatelliteDataProcessor:
                 print("No scenes found in the input folder.")
                 return
 
-            # Display the list of scenes
+            # Display the list of scenes, sorted once per scene grouping
+            if self._sorted_scenes_source is not all_scenes:
+                self._sorted_scene_ids = sorted(all_scenes)
+                self._sorted_scenes_source = all_scenes
             print("Available Scenes:")
-            for scene_id in sorted(all_scenes.keys()):
+            for scene_id in self._sorted_scene_ids:
                 print(f" - {scene_id}")
 
             print(f"\nTotal scenes: {len(all_scenes)}")
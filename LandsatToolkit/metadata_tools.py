@@ -1,10 +1,25 @@
 import os
+import re
+import logging
+from .scene_tools import _scene_id_from_name
+
+logger = logging.getLogger(__name__)
+
+# Splits each MTL line into its leading token ("GROUP =", "END_GROUP" or "<key> =") and the rest
+_MTL_LINE_PATTERN = re.compile(r"^[ \t]*(GROUP =|END_GROUP|[^=\n]*=)(.*)$", re.MULTILINE)
 
 class MetadataManager:
     """
     Handles metadata extraction and parsing for satellite data.
     """
-    def extract_metadata(self, output_folder, scene_id, input_folder):
+    def __init__(self):
+        """
+        Initialize the MetadataManager.
+        """
+        # Cached `_group_files_by_scene` results: folder path -> (folder mtime, scenes)
+        self._scene_cache = {}
+
+    def extract_metadata(self, output_folder, scene_id, input_folder, scene_files=None):
         """
         Extract metadata for a specific scene and save to the output folder.
 
@@ -12,22 +27,25 @@ class MetadataManager:
             output_folder (str): Path to the folder where metadata should be saved.
             scene_id (str): Scene ID to extract metadata for.
             input_folder (str): Path to the folder containing satellite image files.
+            scene_files (list of str, optional): File paths belonging to the scene, if already grouped.
+                                                 The input folder is scanned if None.
 
         Returns:
             None
         """
         try:
-            # Group files by scene
-            scenes = self._group_files_by_scene(input_folder)
+            if scene_files is None:
+                # Group files by scene
+                scenes = self._group_files_by_scene(input_folder)
 
-            if scene_id not in scenes:
-                print(f"Scene '{scene_id}' not found in input folder. Skipping...")
-                return
+                if scene_id not in scenes:
+                    logger.warning("Scene '%s' not found in input folder. Skipping...", scene_id)
+                    return
+                scene_files = scenes[scene_id]
 
-            files = scenes[scene_id]
-            metadata_file = next((f for f in files if f.lower().endswith("_mtl.txt")), None)
+            metadata_file = next((f for f in scene_files if f.lower().endswith("_mtl.txt")), None)
             if not metadata_file:
-                print(f"No metadata file found for scene '{scene_id}'. Skipping...")
+                logger.warning("No metadata file found for scene '%s'. Skipping...", scene_id)
                 return
 
             # Parse metadata
@@ -39,15 +57,17 @@ class MetadataManager:
             # Save metadata to a tabular text file
             output_file_path = os.path.join(output_folder, f"{scene_id}_metadata.txt")
             self._save_metadata(metadata, output_file_path)
-            print(f"Metadata for scene '{scene_id}' saved to {output_file_path}.")
+            logger.info("Metadata for scene '%s' saved to %s.", scene_id, output_file_path)
 
         except Exception as e:
-            print(f"Error extracting metadata for scene '{scene_id}': {e}")
+            logger.error("Error extracting metadata for scene '%s': %s", scene_id, e)
 
     def _group_files_by_scene(self, folder_path):
         """
         Groups files by scene based on naming conventions.
 
+        Results are cached per folder and only rebuilt when the folder's modification time changes.
+
         Args:
             folder_path (str): Path to the folder containing files.
 
@@ -59,16 +79,27 @@ class MetadataManager:
             if not os.path.exists(folder_path):
                 raise FileNotFoundError(f"Input folder '{folder_path}' does not exist.")
 
-            for file_name in os.listdir(folder_path):
-                if file_name.startswith(".") or not file_name.endswith(".txt"):
-                    continue
+            # Reuse the previous scan while the folder contents are unchanged
+            folder_mtime = os.stat(folder_path).st_mtime_ns
+            cached = self._scene_cache.get(folder_path)
+            if cached is not None and cached[0] == folder_mtime:
+                return cached[1]
+
+            # os.scandir entries already carry the joined path, so no per-file os.path.join is needed
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    file_name = entry.name
+                    if file_name.startswith(".") or not file_name.endswith(".txt"):
+                        continue
 
-                scene_id = "_".join(file_name.split("_")[:7])
-                scenes.setdefault(scene_id, []).append(os.path.join(folder_path, file_name))
+                    # Parsed as in SceneOperations.group_files_by_scene, so both produce the same scene IDs
+                    scenes.setdefault(_scene_id_from_name(file_name), []).append(entry.path)
+
+            self._scene_cache[folder_path] = (folder_mtime, scenes)
             return scenes
 
         except Exception as e:
-            print(f"Error grouping files by scene: {e}")
+            logger.error("Error grouping files by scene: %s", e)
             return {}
 
     def _parse_metadata(self, metadata_file_path):
@@ -85,25 +116,23 @@ class MetadataManager:
         current_group = None
         try:
             with open(metadata_file_path, "r") as file:
-                for line in file:
-                    line = line.strip()
-
-                    if line.startswith("GROUP ="):
-                        current_group = line.split("GROUP =")[1].strip()
-                        metadata[current_group] = {}
-                    elif line.startswith("END_GROUP"):
-                        current_group = None
-                    elif "=" in line and current_group:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"')  # Remove quotes
-                        metadata[current_group][key] = value
+                text = file.read()
+
+            # Split all lines with one compiled regex over the whole file
+            for head, rest in _MTL_LINE_PATTERN.findall(text):
+                if head == "GROUP =":
+                    current_group = rest.strip()
+                    metadata[current_group] = {}
+                elif head == "END_GROUP":
+                    current_group = None
+                elif current_group:
+                    metadata[current_group][head[:-1].strip()] = rest.strip().strip('"')  # Remove quotes
             return metadata
 
         except FileNotFoundError:
-            print(f"Metadata file '{metadata_file_path}' not found.")
+            logger.error("Metadata file '%s' not found.", metadata_file_path)
         except Exception as e:
-            print(f"Error parsing metadata file '{metadata_file_path}': {e}")
+            logger.error("Error parsing metadata file '%s': %s", metadata_file_path, e)
         return metadata
 
     def _save_metadata(self, metadata, output_file_path):
@@ -118,15 +147,16 @@ class MetadataManager:
             None
         """
         try:
+            # Build the whole table first and write it with a single call
+            parts = []
+            for group, values in metadata.items():
+                parts.append(f"### {group}\n{'Key':<40} {'Value':<60}\n{'-' * 100}\n")
+                parts.extend(f"{key:<40} {value:<60}\n" for key, value in values.items())
+                parts.append("\n")
+
             with open(output_file_path, "w") as file:
-                for group, values in metadata.items():
-                    file.write(f"### {group}\n")
-                    file.write(f"{'Key':<40} {'Value':<60}\n")
-                    file.write(f"{'-' * 100}\n")
-                    for key, value in values.items():
-                        file.write(f"{key:<40} {value:<60}\n")
-                    file.write("\n")
+                file.write("".join(parts))
         except PermissionError:
-            print(f"Permission denied while writing to file '{output_file_path}'.")
+            logger.error("Permission denied while writing to file '%s'.", output_file_path)
         except Exception as e:
-            print(f"Error saving metadata to file '{output_file_path}': {e}")
\ No newline at end of file
+            logger.error("Error saving metadata to file '%s': %s", output_file_path, e)
\ No newline at end of file
@@ -1,14 +1,128 @@
 import os
+import re
 import shutil
+import logging
+import queue
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager, suppress
 import numpy as np
-import rasterio
-from rasterio.warp import calculate_default_transform, reproject, Resampling
+from .utils import (
+    BAND_MAPPING, DEFAULT_RESAMPLING_METHOD, GDAL_READ_OPTIONS, GEOTIFF_PROFILE, INDEX_BANDS, INDEX_NODATA,
+    INDEX_SCALE_FACTOR, QA_BIT_FLAG_BANDS, QA_RESAMPLING_METHOD, SATELLITE_PREFIXES, atomic_output, geotiff_predictor,
+)
+
+logger = logging.getLogger(__name__)
+
+# rasterio (and with it GDAL) is imported inside the methods reading or writing rasters, so
+# importing the package and tasks that never open a raster (e.g., listing scenes) stay fast
+
+# Band file names end in a band suffix such as "_SR_B4.TIF", "_ST_B10.TIF" or "_QA_PIXEL.TIF"
+_BAND_SUFFIX_PATTERN = re.compile(r"_(SR_B\d+|ST_B\d+|QA_[A-Z]+)(?=[._])", re.IGNORECASE)
+
+def _satellite_type_from_name(file_name):
+    """
+    Returns the satellite type encoded in a file name, or None if it is not recognized.
+    """
+    # Landsat file names start with the sensor code (e.g., "LC08_..."), so only the prefix is looked up
+    return SATELLITE_PREFIXES.get(file_name[:4].lower())
+
+def _scene_id_from_name(file_name):
+    """
+    Returns the scene ID of a file name: the part before its 7th underscore (the whole name if it has fewer).
+    """
+    end = -1
+    for _ in range(7):
+        end = file_name.find("_", end + 1)
+        if end == -1:
+            return file_name
+    return file_name[:end]
+
+def _is_bit_flag_band(file_name):
+    """
+    Returns True if a file name ends in the suffix of a QA band holding bit flags (see `QA_BIT_FLAG_BANDS`).
+    """
+    stem = os.path.splitext(os.path.basename(file_name))[0].upper()
+    return any(stem.endswith(f"_{band}") for band in QA_BIT_FLAG_BANDS)
+
+def _copy_file(src, dst):
+    """
+    Copies the contents of `src` to the file path `dst` (without permission bits).
+
+    Uses `os.copy_file_range` where available, so the kernel copies the data without passing it
+    through user space (or clones it on copy-on-write file systems such as btrfs and XFS), and
+    falls back to `shutil.copyfile` where it is unsupported, e.g., across some file systems.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(src, dst)
+
+# Index Kernels
+"""
+Element-wise index formulas operating on contiguous float32 band arrays. Every supported index
+is a function of the difference and sum of its two bands, so those are computed once per band
+pair and shared by all indices using the pair (e.g., NDVI and SAVI both use NIR and Red).
+"""
+
+def _band_terms(numerator, denominator):
+    """
+    Computes the (numerator - denominator, numerator + denominator) terms shared by the index kernels.
+    """
+    total = np.add(numerator, denominator)
+    difference = np.subtract(numerator, denominator, out=np.empty_like(total))
+    return difference, total
+
+def _divide_or_zero(numerator, total, out=None):
+    """
+    Divides `numerator` by `total`, setting pixels with a zero denominator to 0.
+
+    A plain vectorized division followed by zeroing the (rare) zero-denominator pixels
+    is a single fast pass over the data, unlike a masked `where=` division.
+    `total` is not modified, so it can be shared between indices.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.divide(numerator, total, out=out)
+    np.copyto(out, 0, where=total == 0)
+    return out
+
+def _normalized_difference_kernel(difference, total, L=None):
+    """
+    Computes (numerator - denominator) / (numerator + denominator).
+    """
+    return _divide_or_zero(difference, total)
+
+def _savi_kernel(difference, total, L=0.5):
+    """
+    Computes (1 + L) * (numerator - denominator) / (numerator + denominator + L).
+    """
+    index = np.multiply(difference, 1 + L)
+    return _divide_or_zero(index, total + L, out=index)
 
 class SceneOperations:
     """
     Handles scene processing and index calculation operations.
     """
 
+    # Dispatch table of supported indices: ((numerator band, denominator band), kernel)
+    _INDEX_SPEC = {
+        "NDVI": (INDEX_BANDS["NDVI"], _normalized_difference_kernel),
+        "NDWI": (INDEX_BANDS["NDWI"], _normalized_difference_kernel),
+        "NDBI": (INDEX_BANDS["NDBI"], _normalized_difference_kernel),
+        "SAVI": (INDEX_BANDS["SAVI"], _savi_kernel),
+    }
+
     def __init__(self, input_folder):
         """
         Initialize the SceneOperations with the input folder path.
@@ -25,64 +139,84 @@ class SceneOperations:
             if not os.path.isdir(input_folder):
                 raise ValueError(f"The path '{input_folder}' is not a directory.")
             self.input_folder = input_folder
-            print(f"SceneOperations initialized with input folder: {input_folder}")
+
+            # Cached result of `group_files_by_scene` and the folder mtime it was built for
+            self._scene_cache = None
+            self._scene_cache_mtime = None
+            logger.info("SceneOperations initialized with input folder: %s", input_folder)
         except Exception as e:
-            print(f"Error initializing SceneOperations: {e}")
+            logger.error("Error initializing SceneOperations: %s", e)
             raise
 
     # Scene Processing Methods
-    def organize_satellite_data(self, output_folder):
+    def organize_satellite_data(self, output_folder, max_workers=None, link_when_possible=True):
         """
         Organizes satellite data into the specified output folder.
 
         Args:
             output_folder (str): Path to the folder where organized data will be saved.
+            max_workers (int, optional): Number of threads copying files concurrently.
+                                         Defaults to twice the CPU count, capped at 16.
+            link_when_possible (bool, optional): If True, files are hard-linked instead of copied when the
+                                                 input and output folders share a file system. Defaults to True.
         
         Raises:
             ValueError: If the input folder does not contain any valid files for processing.
         """
         try:
-            scene_files = {}
-
-            # Scan the input folder for files
-            print(f"Scanning input folder: {self.input_folder}")
-            for file_name in os.listdir(self.input_folder):
-                file_path = os.path.join(self.input_folder, file_name)
-
-                # Skip directories and hidden/system files
-                if not os.path.isfile(file_path):
-                    continue
-
-                # Detect the satellite type
-                satellite_type = self.detect_satellite_type(file_name)
-                if not satellite_type:
-                    print(f"Skipping unsupported or unrecognized file: {file_name}")
-                    continue
-
-                # Group files by scene ID
-                scene_id = "_".join(file_name.split("_")[:7])
-                scene_files.setdefault(satellite_type, {}).setdefault(scene_id, []).append(file_path)
+            # Group the input files by scene (shared with, and cached for, the other scene operations)
+            logger.info("Scanning input folder: %s", self.input_folder)
+            scenes = self.group_files_by_scene()
 
             # Raise an error if no valid files are found
-            if not scene_files:
+            if not scenes:
                 raise ValueError("No valid satellite files found in the input folder.")
 
-            # Create the output folder structure and copy files
-            print(f"Organizing data into output folder: {output_folder}")
-            for satellite_type, scenes in scene_files.items():
-                for scene_id, files in scenes.items():
-                    scene_folder = os.path.join(output_folder, satellite_type.upper(), scene_id)
-                    os.makedirs(scene_folder, exist_ok=True)
-                    for file_path in files:
-                        shutil.copy(file_path, scene_folder)
-                        print(f"Copied {file_path} to {scene_folder}")
-
-            print("Satellite data organization complete.")
+            # Create the output folder structure once, collecting the files to copy
+            logger.info("Organizing data into output folder: %s", output_folder)
+            copies = []
+            for scene_id, files in scenes.items():
+                # All files of a scene share the scene ID's sensor code
+                satellite_type = self.detect_satellite_type(scene_id)
+                scene_folder = os.path.join(output_folder, satellite_type.upper(), scene_id)
+                os.makedirs(scene_folder, exist_ok=True)
+                copies.extend((file_path, scene_folder) for file_path in files)
+
+            def copy_file(copy):
+                file_path, scene_folder = copy
+                target = os.path.join(scene_folder, os.path.basename(file_path))
+                try:
+                    # Already linked by an earlier run (copying onto it would truncate the input)
+                    if os.path.exists(target) and os.path.samefile(file_path, target):
+                        return True
+                    if link_when_possible:
+                        # A hard link is a metadata-only operation; it fails across devices or on
+                        # file systems without hard links, in which case the file is copied instead
+                        try:
+                            os.link(file_path, target)
+                            logger.debug("Linked %s into %s", file_path, scene_folder)
+                            return True
+                        except OSError:
+                            pass
+                    _copy_file(file_path, target)
+                    logger.debug("Copied %s to %s", file_path, scene_folder)
+                    return True
+                except OSError as e:
+                    logger.error("Error copying %s to %s: %s", file_path, scene_folder, e)
+                    return False
+
+            # Copying is I/O bound, so the copies are overlapped in a thread pool
+            if max_workers is None:
+                max_workers = min(16, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                copied = sum(executor.map(copy_file, copies))
+
+            logger.info("Satellite data organization complete: %d of %d files organized.", copied, len(copies))
 
         except ValueError as ve:
-            print(f"ValueError: {ve}")
+            logger.error("ValueError: %s", ve)
         except Exception as e:
-            print(f"An error occurred while organizing satellite data: {e}")
+            logger.error("An error occurred while organizing satellite data: %s", e)
 
     def detect_satellite_type(self, file_name):
         """
@@ -98,35 +232,25 @@ class SceneOperations:
         Raises:
             ValueError: If the file_name is empty or None.
         """
-        try:
-            # Validate input
-            if not file_name:
-                raise ValueError("File name cannot be empty or None.")
-
-            # Convert file name to lowercase for uniform comparison
-            file_name = file_name.lower()
-
-            # Detect satellite type based on naming patterns
-            if "le07" in file_name:
-                return "landsat7"
-            elif "lc08" in file_name:
-                return "landsat8"
-            elif "lc09" in file_name:
-                return "landsat9"
+        # Validate input (called once per file, so errors are left to the callers to handle)
+        if not file_name:
+            raise ValueError("File name cannot be empty or None.")
 
-            # If no pattern matches, print and return None
-            print(f"Unsupported satellite type for file: {file_name}")
-            return None
+        # Detect satellite type based on the sensor code prefix
+        satellite_type = _satellite_type_from_name(file_name)
+        if satellite_type:
+            return satellite_type
 
-        except ValueError as ve:
-            print(f"ValueError: {ve}")
-        except Exception as e:
-            print(f"An error occurred while detecting satellite type: {e}")
+        # If no pattern matches, log and return None
+        logger.debug("Unsupported satellite type for file: %s", file_name)
+        return None
 
     def group_files_by_scene(self):
         """
         Groups files by scene based on satellite type.
 
+        The result is cached and only rebuilt when the input folder's modification time changes.
+
         Returns:
             dict: Dictionary with scene IDs as keys and lists of file paths as values.
                   Example:
@@ -147,206 +271,576 @@ class SceneOperations:
             if not os.path.exists(self.input_folder):
                 raise FileNotFoundError(f"Input folder '{self.input_folder}' does not exist.")
 
+            # Reuse the previous scan while the folder contents are unchanged
+            folder_mtime = os.stat(self.input_folder).st_mtime_ns
+            if self._scene_cache is not None and folder_mtime == self._scene_cache_mtime:
+                return self._scene_cache
+
             scenes = {}
-            file_list = os.listdir(self.input_folder)  # List all files in the input folder
+            with os.scandir(self.input_folder) as it:
+                file_list = list(it)  # List all entries in the input folder
 
             # Iterate over each file in the folder
-            for file_name in file_list:
-                # Skip hidden files (e.g., starting with ".")
-                if file_name.startswith("."):
+            for entry in file_list:
+                file_name = entry.name
+                # Skip hidden files (e.g., starting with ".") and directories
+                if file_name.startswith(".") or not entry.is_file():
                     continue
 
                 # Detect the satellite type
                 satellite_type = self.detect_satellite_type(file_name)
                 if not satellite_type:
-                    print(f"Skipping file '{file_name}': Unrecognized satellite type.")
+                    logger.debug("Skipping file '%s': Unrecognized satellite type.", file_name)
                     continue
 
                 # Generate scene ID based on naming convention
-                scene_id = "_".join(file_name.split("_")[:7])
+                scene_id = _scene_id_from_name(file_name)
 
                 # Add the file to the corresponding scene in the dictionary
-                full_path = os.path.join(self.input_folder, file_name)
-                scenes.setdefault(scene_id, []).append(full_path)
+                scenes.setdefault(scene_id, []).append(entry.path)
 
             # Print summary of grouped scenes
-            print(f"Grouped {len(scenes)} scenes from {len(file_list)} files.")
+            logger.info("Grouped %d scenes from %d files.", len(scenes), len(file_list))
+            self._scene_cache = scenes
+            self._scene_cache_mtime = folder_mtime
             return scenes
 
         except FileNotFoundError as fnfe:
-            print(f"FileNotFoundError: {fnfe}")
+            logger.error("FileNotFoundError: %s", fnfe)
         except Exception as e:
-            print(f"An unexpected error occurred while grouping files: {e}")
+            logger.error("An unexpected error occurred while grouping files: %s", e)
+
+    def invalidate_cache(self):
+        """
+        Discards the cached scene grouping, so the next lookup rescans the input folder.
+
+        The cache is already refreshed when the input folder's modification time changes; this is
+        only needed when files are replaced in place or on file systems with coarse timestamps.
+        """
+        self._scene_cache = None
+        self._scene_cache_mtime = None
+
+    def _files_for_scene(self, scene_id):
+        """
+        Returns the paths of the files belonging to a single scene.
+
+        Uses the cached grouping of `group_files_by_scene` while it is up to date; otherwise only the
+        files named after the scene are collected, without detecting and grouping every other file.
 
-    def create_band_matrices(self, scene_id):
+        Args:
+            scene_id (str): Scene ID to look up.
+
+        Returns:
+            list of str: File paths of the scene (empty if the scene is not in the input folder).
+        """
+        if self._scene_cache is not None and os.stat(self.input_folder).st_mtime_ns == self._scene_cache_mtime:
+            return self._scene_cache.get(scene_id, [])
+
+        with os.scandir(self.input_folder) as it:
+            return sorted(
+                entry.path for entry in it
+                if entry.name.startswith(scene_id) and _scene_id_from_name(entry.name) == scene_id and entry.is_file()
+            )
+
+    def create_band_matrices(self, scene_id, bands=None, return_meta=False, memmap_file=None, scene_files=None):
         """
         Creates a 3D band matrix for the specified scene by stacking individual bands.
 
         Args:
             scene_id (str): Scene ID to create band matrices for.
+            bands (list of str or int, optional): Bands to stack, in order, given by name (e.g., ["nir", "red"];
+                                                  see `BAND_MAPPING`) or by surface reflectance band number
+                                                  (e.g., [5, 4]). Only these band files are read. If None,
+                                                  all surface reflectance bands are stacked.
+            return_meta (bool, optional): If True, also return the raster metadata of the stack (CRS,
+                                          transform, size, ...), taken from the first band while it is open,
+                                          so outputs can be written without reopening a band file. Default is False.
+            memmap_file (str, optional): Path of a `.npy` file to hold the matrix as a memory map instead of
+                                         in memory. The bands are read straight into the file, and the OS page
+                                         cache, not the process, holds the data; the file is left for the caller
+                                         to delete (see `band_stack` for a temporary file removed on exit). Every
+                                         band must then be read: on failure, the file is removed and None is
+                                         returned. If None, the matrix is allocated in memory.
+            scene_files (list of str, optional): File paths belonging to the scene, if already grouped.
+                                                 Looked up with `_files_for_scene` if None.
 
         Returns:
             np.ndarray: 3D NumPy array representing the stacked bands.
+            tuple: (matrix, meta) if `return_meta` is True.
 
         Raises:
-            ValueError: If no valid band files are found for the specified scene.
-            FileNotFoundError: If the scene ID does not exist in the grouped files.
+            ValueError: If no valid band files are found for the specified scene, or a requested band cannot be read.
+            FileNotFoundError: If the scene ID does not exist in the grouped files, or a requested band is missing.
         """
+        memmap_created = False
         try:
-            # Get files associated with the scene ID
-            scene_files = self.group_files_by_scene().get(scene_id, [])
+            import rasterio
+
+            # Get files associated with the scene ID, unless the caller already grouped them
+            if scene_files is None:
+                scene_files = self._files_for_scene(scene_id)
             if not scene_files:
                 raise FileNotFoundError(f"Scene ID '{scene_id}' not found in the input folder.")
 
-            band_arrays = []
+            if bands is not None:
+                # Read only the requested bands, e.g., those needed by the indices to calculate.
+                # Band names are resolved through `BAND_MAPPING`, band numbers directly from the file names
+                band_index = self.index_band_files(scene_files)
+                band_files = self.find_band_files(scene_files, self.detect_satellite_type(scene_id), band_index=band_index)
+                file_paths = [band_index.get(f"SR_B{band}") if isinstance(band, int) else band_files.get(band) for band in bands]
+                missing = [str(band) for band, file_path in zip(bands, file_paths) if file_path is None]
+                if missing:
+                    raise FileNotFoundError(f"Band(s) {', '.join(missing)} not found for scene '{scene_id}'.")
+            else:
+                # Stack all surface reflectance bands ordered by band number (not by listing order)
+                band_index = self.index_band_files(scene_files)
+                sr_bands = sorted((suffix for suffix in band_index if suffix.startswith("SR_B")), key=lambda suffix: int(suffix[4:]))
+                file_paths = [band_index[suffix] for suffix in sr_bands]
+            if not file_paths:
+                raise ValueError(f"No valid band files found for scene '{scene_id}'.")
 
-            # Iterate through the files and read band data
-            for file_path in scene_files:
-                if "_sr_b" in file_path.lower():  # Filter for specific band files
-                    try:
-                        with rasterio.open(file_path) as src:
-                            band_arrays.append(src.read(1))  # Read the band data as a 2D array
-                    except rasterio.errors.RasterioIOError as rio_err:
-                        print(f"RasterioIOError: Could not read file '{file_path}': {rio_err}")
-                    except Exception as e:
-                        print(f"Error reading band file '{file_path}': {e}")
+            # The 3D matrix is allocated once, from the first band's size and type, and
+            # each band is read directly into its slice (no per-band arrays to stack)
+            with rasterio.Env(**GDAL_READ_OPTIONS), rasterio.open(file_paths[0]) as src:
+                shape = (len(file_paths), src.height, src.width)
+                if memmap_file is not None:
+                    memmap_created = True
+                    matrix = np.lib.format.open_memmap(memmap_file, mode="w+", dtype=src.dtypes[0], shape=shape)
+                else:
+                    matrix = np.empty(shape, dtype=src.dtypes[0])
+                meta = src.meta.copy()
+
+            def _load(i):
+                # Each band file is opened, read and closed in the same thread, in that thread's GDAL environment
+                file_path = file_paths[i]
+                try:
+                    with rasterio.Env(**GDAL_READ_OPTIONS), rasterio.open(file_path) as src:
+                        src.read(1, out=matrix[i])  # Read the band data into its 2D slice
+                    return True
+                except rasterio.errors.RasterioIOError as rio_err:
+                    logger.error("RasterioIOError: Could not read file '%s': %s", file_path, rio_err)
+                except Exception as e:
+                    logger.error("Error reading band file '%s': %s", file_path, e)
+                return False
+
+            # Band files are independent and GDAL releases the GIL while reading, so they are read concurrently
+            with ThreadPoolExecutor(max_workers=min(len(file_paths), 8)) as executor:
+                read = list(executor.map(_load, range(len(file_paths))))
+            count = sum(read)
 
             # Raise an error if no valid band files were found
-            if not band_arrays:
+            if not count:
                 raise ValueError(f"No valid band files found for scene '{scene_id}'.")
 
-            # Stack the band arrays into a single 3D matrix
-            matrix = np.stack(band_arrays, axis=0)
-            print(f"Band matrix created for scene '{scene_id}'. Shape: {matrix.shape}")
+            # Requested bands keep their positions (matrix[i] is bands[i]), so none may be missing
+            if bands is not None and count < len(file_paths):
+                unread = [str(band) for band, ok in zip(bands, read) if not ok]
+                raise ValueError(f"Band(s) {', '.join(unread)} could not be read for scene '{scene_id}'.")
+
+            # Drop the slices of bands that could not be read. The depth of a memory-mapped
+            # file is fixed, so it is left whole or not at all
+            if count < len(file_paths):
+                if memmap_file is not None:
+                    unread = [file_path for file_path, ok in zip(file_paths, read) if not ok]
+                    raise ValueError(f"Band file(s) {', '.join(unread)} could not be read into '{memmap_file}'.")
+                matrix = matrix[np.flatnonzero(read)]
+            elif memmap_file is not None:
+                matrix.flush()
+            logger.info("Band matrix created for scene '%s'. Shape: %s", scene_id, matrix.shape)
+            if return_meta:
+                meta.update(count=matrix.shape[0])
+                return matrix, meta
             return matrix
 
         except FileNotFoundError as fnf_error:
-            print(f"FileNotFoundError: {fnf_error}")
+            logger.error("FileNotFoundError: %s", fnf_error)
         except ValueError as val_error:
-            print(f"ValueError: {val_error}")
+            logger.error("ValueError: %s", val_error)
         except Exception as e:
-            print(f"An unexpected error occurred while creating band matrices: {e}")
+            logger.error("An unexpected error occurred while creating band matrices: %s", e)
 
-    def calculate_and_save_index(self, band_matrix, index_type, satellite_type, output_file, B4=None, L=0.5):
+        # Only reached on errors: a partly written memory-mapped file is not left behind
+        if memmap_created:
+            matrix = None  # Release the mapping before removing its file
+            with suppress(FileNotFoundError):
+                os.remove(memmap_file)
+
+    @contextmanager
+    def band_stack(self, scene_id, bands=None, return_meta=False, temp_dir=None, scene_files=None):
+        """
+        Context manager holding the band matrix of a scene in a temporary memory-mapped file.
+
+        The matrix is created by `create_band_matrices` in a `.npy` file that is removed on exit,
+        including when the block raises, so large stacks never outlive their use.
+
+        Args:
+            scene_id (str): Scene ID to create band matrices for.
+            bands (list of str or int, optional): Bands to stack, in order (see `create_band_matrices`).
+            return_meta (bool, optional): If True, yield (matrix, meta). Default is False.
+            temp_dir (str, optional): Folder for the temporary file. If None, the system temporary folder is used.
+            scene_files (list of str, optional): File paths belonging to the scene, if already grouped.
+
+        Yields:
+            np.memmap: 3D memory-mapped array representing the stacked bands.
+            tuple: (matrix, meta) if `return_meta` is True.
+
+        Raises:
+            ValueError: If the band matrix cannot be created.
+        """
+        fd, memmap_file = tempfile.mkstemp(suffix=".npy", dir=temp_dir)
+        os.close(fd)
+        result = None
+        try:
+            result = self.create_band_matrices(scene_id, bands, return_meta=return_meta, memmap_file=memmap_file,
+                                               scene_files=scene_files)
+            if result is None:
+                raise ValueError(f"Band matrix could not be created for scene '{scene_id}'.")
+            yield result
+        finally:
+            result = None  # Release the mapping before removing its file
+            with suppress(FileNotFoundError):
+                os.remove(memmap_file)
+
+    def index_band_files(self, scene_files):
+        """
+        Maps the band suffixes of a scene's files to their paths.
+
+        Each file name is parsed once, so any band can then be looked up directly
+        (e.g., `index_band_files(files).get("SR_B4")`).
+
+        Args:
+            scene_files (list of str): File paths belonging to a single scene.
+
+        Returns:
+            dict: Dictionary with upper-case band suffixes (e.g., "SR_B4", "ST_B10", "QA_PIXEL")
+                  as keys and file paths as values. Files without a band suffix are left out.
+        """
+        band_index = {}
+        for file_path in scene_files:
+            match = _BAND_SUFFIX_PATTERN.search(os.path.basename(file_path))
+            if match:
+                band_index.setdefault(match.group(1).upper(), file_path)
+        return band_index
+
+    def find_band_files(self, scene_files, satellite_type, band_index=None):
+        """
+        Maps band names to the surface reflectance band files of a scene.
+
+        Args:
+            scene_files (list of str): File paths belonging to a single scene.
+            satellite_type (str): Satellite type (e.g., "landsat8").
+            band_index (dict, optional): The scene's band suffixes mapped to file paths, as returned
+                                         by `index_band_files`. Built from `scene_files` if None.
+
+        Returns:
+            dict: Dictionary with band names (e.g., "red", "nir") as keys and file paths as values.
+
+        Raises:
+            ValueError: If the satellite type is not supported.
+        """
+        if satellite_type not in BAND_MAPPING:
+            raise ValueError(f"Unsupported satellite type: {satellite_type}")
+
+        if band_index is None:
+            band_index = self.index_band_files(scene_files)
+
+        band_files = {}
+        for band_name, band_number in BAND_MAPPING[satellite_type].items():
+            file_path = band_index.get(f"SR_B{band_number}")
+            if file_path:
+                band_files[band_name] = file_path
+        return band_files
+
+    def read_band(self, src, window=None, out=None):
+        """
+        Reads the first band of an open raster dataset directly into a float32 array.
+
+        Args:
+            src (rasterio.io.DatasetReader): Open raster dataset to read from.
+            window (rasterio.windows.Window, optional): Window to read. Reads the full band if None.
+            out (np.ndarray, optional): Preallocated float32 array matching the window shape.
+                                        A new array is allocated if None.
+
+        Returns:
+            np.ndarray: 2D float32 array with the band data.
+        """
+        if out is None:
+            shape = (window.height, window.width) if window is not None else src.shape
+            out = np.empty(shape, dtype=np.float32)
+        # rasterio converts to float32 while reading, so no extra copy is made
+        return src.read(1, window=window, out=out)
+
+    def calculate_and_save_index(self, band_files, index_type, satellite_type, output_file, B4=None, L=0.5, quantize=False):
         """
-        Calculates a normalized difference index for a given band matrix and saves it to a GeoTIFF file.
+        Calculates a normalized difference index from the scene's band files and saves it to a GeoTIFF file.
+
+        Only the two bands required by the index are read, and the index is computed and
+        written one output tile at a time so the full scene is never held in memory.
 
         Args:
-            band_matrix (np.ndarray): 3D NumPy array of band data.
+            band_files (dict): Band names mapped to band file paths, as returned by `find_band_files`.
             index_type (str): Type of index to calculate (e.g., "NDVI", "NDWI", "NDBI", "SAVI").
             satellite_type (str): Satellite type (e.g., "landsat7").
             output_file (str): Path to save the calculated index.
-            B4 (str): Path to B4 file for metadata reference.
+            B4 (str, optional): Path to a raster whose grid (CRS, transform and size) the outputs use.
+                                Defaults to the grid of the index bands.
             L (float, optional): Soil adjustment factor for SAVI. Default is 0.5.
+            quantize (bool, optional): If True, save the index as int16 scaled by 10000 (with the
+                                       GeoTIFF scale set to 0.0001) instead of float32. Pixels where a band
+                                       is nodata or the denominator is 0 are set to `INDEX_NODATA`. Default is False.
 
         Returns:
             None
 
         Raises:
             ValueError: If the index type is unsupported.
-            FileNotFoundError: If the B4 reference file is not provided or invalid.
+            FileNotFoundError: If a required band file or the given B4 reference file is missing.
+            Exception: For unexpected errors during index calculation or saving.
+        """
+        self.calculate_and_save_indices(
+            band_files=band_files,
+            output_files={index_type: output_file},
+            satellite_type=satellite_type,
+            B4=B4,
+            L=L,
+            quantize=quantize,
+        )
+
+    def calculate_and_save_indices(self, band_files, output_files, satellite_type, B4=None, L=0.5, quantize=False,
+                                   tile_workers=1):
+        """
+        Calculates several normalized difference indices in one pass and saves each to a GeoTIFF file.
+
+        Every band needed by the requested indices is read once per output tile and shared by
+        all indices using it (e.g., NIR for NDVI, NDWI, NDBI and SAVI), so each band file is
+        read from disk only once. Only a few tiles are held in memory at any time.
+
+        Args:
+            band_files (dict): Band names mapped to band file paths, as returned by `find_band_files`.
+            output_files (dict): Index types (e.g., "NDVI") mapped to the paths to save them to.
+            satellite_type (str): Satellite type (e.g., "landsat7").
+            B4 (str, optional): Path to a raster whose grid (CRS, transform and size) the outputs use.
+                                Defaults to the grid of the index bands.
+            L (float, optional): Soil adjustment factor for SAVI. Default is 0.5.
+            quantize (bool, optional): If True, save the indices as int16 scaled by 10000 (with the
+                                       GeoTIFF scale set to 0.0001) instead of float32. Pixels where a band
+                                       is nodata or the denominator is 0 are set to `INDEX_NODATA`. Default is False.
+            tile_workers (int, optional): Number of threads reading and computing tiles concurrently, and
+                                          compressing each output. Outputs are always written from the
+                                          calling thread. Default is 1.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError: If an index type is unsupported.
+            FileNotFoundError: If a required band file or the given B4 reference file is missing.
             Exception: For unexpected errors during index calculation or saving.
         """
         try:
-            print(f"Calculating {index_type} for satellite type {satellite_type}...")
-
-            # Check if the index is supported and call `normalized_difference`
-            if index_type in ["NDVI", "NDWI", "NDBI", "SAVI"]:
-                band_indices = {
-                    "NDVI": (4, 3),  # NIR, RED
-                    "NDWI": (2, 4),  # GREEN, NIR
-                    "NDBI": (5, 4),  # SWIR, NIR
-                    "SAVI": (4, 3),  # NIR, RED
-                }
-                numerator_band, denominator_band = band_indices[index_type]
-                
-                # Pass the L value only if the index is SAVI
-                index = self.normalized_difference(
-                    matrix=band_matrix,
-                    numerator_band=numerator_band,
-                    denominator_band=denominator_band,
-                    index_type=index_type,
-                    L=L if index_type == "SAVI" else None,
-                )
-            else:
-                raise ValueError(f"Unsupported index type: {index_type}")
-            
-            # Validate the B4 reference file
-            if B4 is None or not os.path.isfile(B4):
+            import rasterio
+
+            output_files = {index_type.upper(): path for index_type, path in output_files.items()}
+            logger.info("Calculating %s for satellite type %s...", ", ".join(output_files), satellite_type)
+
+            # Check if the indices are supported and that their bands are available
+            band_names = []
+            for index_type in output_files:
+                if index_type not in self._INDEX_SPEC:
+                    raise ValueError(f"Unsupported index type: {index_type}")
+
+                for band_name in self._INDEX_SPEC[index_type][0]:
+                    if band_name not in band_files:
+                        raise FileNotFoundError(f"{band_name.upper()} band file required for {index_type} not found.")
+                    if band_name not in band_names:
+                        band_names.append(band_name)
+
+            # Validate the B4 reference file, if given
+            if B4 is not None and not os.path.isfile(B4):
                 raise FileNotFoundError(f"B4 reference file not found or invalid: {B4}")
 
-            # Save the calculated index as a GeoTIFF
-            with rasterio.open(B4) as src:
-                meta = src.meta.copy()
-                meta.update(count=1, dtype="float32")
-                
+            with ExitStack() as stack:
+                # Each thread reading tiles borrows its own set of band datasets (a dataset must not be
+                # read by two threads at once) and a buffer reused for all the set's band tiles. Each
+                # band stays planar so the index math runs on contiguous SIMD-friendly rows
+                block_size = GEOTIFF_PROFILE["blockxsize"] * GEOTIFF_PROFILE["blockysize"]
+                band_readers = queue.SimpleQueue()
+                stack.enter_context(rasterio.Env(**GDAL_READ_OPTIONS))
+                for _ in range(max(1, tile_workers)):
+                    sources = {name: stack.enter_context(rasterio.open(band_files[name])) for name in band_names}
+                    band_readers.put((sources, np.empty((len(band_names), block_size), dtype=np.float32)))
+
+                # Nodata values of the index bands (the same for each set of open datasets)
+                band_nodata = {name: src.nodata for name, src in sources.items()}
+
+                # The outputs share the grid of the index bands, taken from an already open band
+                # (or from the B4 reference file, if given)
+                if B4 is not None:
+                    with rasterio.open(B4) as src:
+                        meta = src.meta.copy()
+                else:
+                    meta = sources[band_names[0]].meta.copy()
+                if quantize:
+                    meta.update(count=1, dtype="int16", nodata=INDEX_NODATA)
+                    # Tiled, compressed output; predictor 2 is the integer predictor
+                    meta.update(GEOTIFF_PROFILE, predictor=2)
+                else:
+                    meta.update(count=1, dtype="float32")
+                    # Tiled, compressed output; predictor 3 is the floating point predictor
+                    meta.update(GEOTIFF_PROFILE, predictor=3)
+                # Outputs are compressed with the scene's share of the threads, not all CPUs
+                meta.update(num_threads=max(1, tile_workers))
+
+                # Open every output once. Each is written to a temporary file, renamed to the output
+                # file only once all its tiles are written (datasets close before the rename)
                 try:
-                    with rasterio.open(output_file, "w", **meta) as dst:
-                        dst.write(index.astype("float32"), 1)
+                    outputs = {}
+                    for index_type, output_file in output_files.items():
+                        temp_file = stack.enter_context(atomic_output(output_file))
+                        outputs[index_type] = stack.enter_context(rasterio.open(temp_file, "w", **meta))
+                        if quantize:
+                            outputs[index_type].scales = (INDEX_SCALE_FACTOR,)
                 except Exception as save_error:
-                    raise Exception(f"Error saving index to file '{output_file}': {save_error}")
+                    raise Exception(f"Error creating index file '{output_file}': {save_error}")
 
-            print(f"{index_type} index saved to {output_file}")
+                def compute_tile(window):
+                    sources, band_buffer = band_readers.get()
+                    try:
+                        # Contiguous views sized to the window (edge tiles are smaller)
+                        shape = (window.height, window.width)
+                        size = window.height * window.width
+                        tiles = band_buffer[:, :size].reshape((len(band_names),) + shape)
+
+                        # Read each band's tile once for all indices
+                        bands = {}
+                        for tile, name in zip(tiles, band_names):
+                            bands[name] = self.read_band(sources[name], window, out=tile)
+
+                        # Difference and sum of each band pair, shared by the indices using that pair
+                        pair_terms = {}
+                        indices = {}
+                        for index_type in output_files:
+                            pair = self._INDEX_SPEC[index_type][0]
+                            if pair not in pair_terms:
+                                pair_terms[pair] = _band_terms(bands[pair[0]], bands[pair[1]])
+
+                            # Pass the L value only if the index is SAVI
+                            index = self.normalized_difference(
+                                matrix=bands,
+                                numerator_band=pair[0],
+                                denominator_band=pair[1],
+                                index_type=index_type,
+                                L=L if index_type == "SAVI" else None,
+                                terms=pair_terms[pair],
+                            )
+                            if quantize:
+                                # Clipped indices stay within +/-10000, so the int16 cast cannot overflow
+                                np.multiply(index, 1 / INDEX_SCALE_FACTOR, out=index)
+                                index = np.rint(index, out=index).astype(np.int16)
+
+                                # Pixels without an index (a band's nodata, or a zero denominator) are set to
+                                # the nodata value, since 0 is a valid index value
+                                invalid = pair_terms[pair][1] == (-L if index_type == "SAVI" else 0)
+                                for name in pair:
+                                    if band_nodata[name] is not None:
+                                        invalid |= bands[name] == band_nodata[name]
+                                index[invalid] = INDEX_NODATA
+                            indices[index_type] = index
+                        return indices
+                    finally:
+                        band_readers.put((sources, band_buffer))
+
+                def computed_tiles(windows):
+                    if tile_workers <= 1:
+                        for window in windows:
+                            yield window, compute_tile(window)
+                        return
+
+                    # Tiles are read and computed in worker threads (rasterio releases the GIL while
+                    # reading, NumPy while computing), at most two per thread ahead of the writes
+                    with ThreadPoolExecutor(max_workers=tile_workers) as executor:
+                        pending = deque()
+                        for window in windows:
+                            pending.append((window, executor.submit(compute_tile, window)))
+                            if len(pending) > 2 * tile_workers:
+                                done_window, future = pending.popleft()
+                                yield done_window, future.result()
+                        while pending:
+                            done_window, future = pending.popleft()
+                            yield done_window, future.result()
+
+                # Outputs are only written from this thread, in tile order
+                reference = next(iter(outputs.values()))
+                windows = [window for _, window in reference.block_windows(1)]
+                for window, indices in computed_tiles(windows):
+                    for index_type, index in indices.items():
+                        try:
+                            outputs[index_type].write(index, 1, window=window)
+                        except Exception as save_error:
+                            raise Exception(f"Error saving index to file '{output_files[index_type]}': {save_error}")
+
+            for index_type, output_file in output_files.items():
+                logger.debug("%s index saved to %s", index_type, output_file)
 
         except ValueError as ve:
-            print(f"ValueError: {ve}")
+            logger.error("ValueError: %s", ve)
             raise
         except FileNotFoundError as fnf_error:
-            print(f"FileNotFoundError: {fnf_error}")
+            logger.error("FileNotFoundError: %s", fnf_error)
             raise
         except Exception as e:
-            print(f"An unexpected error occurred while calculating or saving the index: {e}")
+            logger.error("An unexpected error occurred while calculating or saving the indices: %s", e)
             raise
 
-    def normalized_difference(self, matrix, numerator_band, denominator_band, index_type, L=0.5):
+    def normalized_difference(self, matrix, numerator_band, denominator_band, index_type, L=0.5, terms=None):
         """
         Calculates a normalized difference index for specified bands and standardizes values for each pixel.
 
         Args:
-            matrix (np.ndarray): 3D NumPy array with band data.
-            numerator_band (int): Index of the numerator band.
-            denominator_band (int): Index of the denominator band.
+            matrix (np.ndarray or dict): 3D NumPy array with band data, or a mapping of band keys to 2D arrays.
+            numerator_band (int or str): Index (or key) of the numerator band.
+            denominator_band (int or str): Index (or key) of the denominator band.
             index_type (str): Type of index (e.g., NDVI, NDWI, NDBI, SAVI).
             L (float, optional): Soil adjustment factor for SAVI, default is 0.5.
+            terms (tuple, optional): Precomputed float32 (numerator - denominator, numerator + denominator)
+                                     arrays, shared between indices of the same band pair. They are not
+                                     modified. Computed from `matrix` if None.
 
         Returns:
             np.ndarray: Normalized difference index values clipped to the expected range.
         """
-        try:
-            numerator = matrix[numerator_band]
-            denominator = matrix[denominator_band]
-
-            # Handle SAVI calculation
-            if index_type == "SAVI":
-                with np.errstate(divide="ignore", invalid="ignore"):
-                    index = ((numerator - denominator) / (numerator + denominator + L)) * (1 + L)
-                    index = np.where(np.isfinite(index), index, 0)  # Replace NaN or Inf with 0
-            else:
-                # Handle other normalized difference calculations
-                with np.errstate(divide="ignore", invalid="ignore"):
-                    index = (numerator - denominator) / (numerator + denominator)
-                    index = np.where(np.isfinite(index), index, 0)  # Replace NaN or Inf with 0
-
-            # Standardize the values based on the index type
-            index_ranges = {
-                "NDVI": (-1, 1),  # NDVI range
-                "NDWI": (-1, 1),  # NDWI range
-                "NDBI": (-1, 1),  # NDBI range
-                "SAVI": (-1, 1),  # SAVI range (adjustable with L)
-            }
-
-            if index_type in index_ranges:
-                min_val, max_val = index_ranges[index_type]
-                index = np.clip(index, min_val, max_val)  # Clip values to the specified range
-            else:
-                print(f"Warning: No standardization range defined for index type {index_type}. Skipping clipping.")
-
-            return index
-        except Exception as e:
-            print(f"Error calculating {index_type}: {e}")
-            raise
-            
-    def reproject_scene(self, scene_id, target_crs, output_folder):
+        if terms is None:
+            # Work on contiguous float32 data (also avoids unsigned wrap-around on raw UInt16 bands)
+            # so NumPy can use its AVX2/AVX-512 loops, which it selects at runtime for the CPU
+            numerator = np.ascontiguousarray(matrix[numerator_band], dtype=np.float32)
+            denominator = np.ascontiguousarray(matrix[denominator_band], dtype=np.float32)
+            terms = _band_terms(numerator, denominator)
+
+        # Look up the index formula; unknown index types fall back to a plain normalized difference
+        if index_type in self._INDEX_SPEC:
+            _, kernel = self._INDEX_SPEC[index_type]
+        else:
+            kernel = _normalized_difference_kernel
+        index = kernel(*terms, L)
+
+        # Standardize the values based on the index type
+        index_ranges = {
+            "NDVI": (-1, 1),  # NDVI range
+            "NDWI": (-1, 1),  # NDWI range
+            "NDBI": (-1, 1),  # NDBI range
+            "SAVI": (-1, 1),  # SAVI range (adjustable with L)
+        }
+
+        if index_type in index_ranges:
+            min_val, max_val = index_ranges[index_type]
+            np.clip(index, min_val, max_val, out=index)  # Clip values in place to the specified range
+        else:
+            logger.warning("No standardization range defined for index type %s. Skipping clipping.", index_type)
+
+        return index
+
+    def reproject_scene(self, scene_id, target_crs, output_folder, resampling=DEFAULT_RESAMPLING_METHOD,
+                        num_threads=None, warp_mem_limit=512, scene_files=None):
         """
         Reprojects all raster files in a scene to a specified CRS.
 
@@ -354,28 +848,55 @@ class SceneOperations:
             scene_id (str): Scene ID to reproject.
             target_crs (str): Target CRS (e.g., "EPSG:32633").
             output_folder (str): Path to the folder where reprojected files will be saved.
+            resampling (str or rasterio.enums.Resampling, optional): Resampling method for continuous bands, by
+                                        name (e.g., "nearest", "bilinear") or as a `Resampling` member
+                                        (e.g., `Resampling.bilinear`). Bit flag QA bands (see `QA_BIT_FLAG_BANDS`) are always resampled with
+                                        "nearest". Default is "bilinear".
+            num_threads (int, optional): Number of threads used for warping and compressing the outputs, shared
+                                         between the scene's files warped concurrently. Defaults to the number of CPUs.
+            warp_mem_limit (int, optional): Working memory of the warp operation in MB. Default is 512.
+            scene_files (list of str, optional): File paths belonging to the scene, if already grouped.
+                                                 Looked up with `group_files_by_scene` if None.
 
         Returns:
             None
         """
         try:
-            print(f"Reprojecting scene: {scene_id} to {target_crs}...")
+            import rasterio
+            from rasterio.warp import calculate_default_transform, reproject, Resampling
+
+            resampling = resampling if isinstance(resampling, Resampling) else Resampling[resampling]
+            qa_resampling = Resampling[QA_RESAMPLING_METHOD]
+            num_threads = num_threads or os.cpu_count()
+
+            logger.info("Reprojecting scene: %s to %s...", scene_id, target_crs)
 
             # Get files associated with the scene
-            scene_files = self.group_files_by_scene().get(scene_id, [])
+            if scene_files is None:
+                scene_files = self._files_for_scene(scene_id)
             if not scene_files:
-                print(f"No files found for scene {scene_id}. Skipping...")
+                logger.warning("No files found for scene %s. Skipping...", scene_id)
                 return
 
-            for file_path in scene_files:
-                # Skip non-raster files
-                if not file_path.lower().endswith(('.tif', '.geotiff')):
-                    continue
+            # Skip non-raster files
+            raster_files = [f for f in scene_files if f.lower().endswith(('.tif', '.geotiff'))]
+            if not raster_files:
+                logger.warning("No raster files found for scene %s. Skipping...", scene_id)
+                return
 
+            # All outputs go to the same folder, created once for the scene
+            os.makedirs(output_folder, exist_ok=True)
+
+            # The files are warped concurrently (GDAL releases the GIL while warping), sharing the
+            # warp and compression threads between them; each file is opened and closed in its own thread
+            file_workers = max(1, min(len(raster_files), num_threads))
+            warp_threads = max(1, num_threads // file_workers)
+
+            def reproject_file(file_path):
                 try:
                     # Open the raster file
                     with rasterio.open(file_path) as src:
-                        print(f"Processing file: {file_path}")
+                        logger.debug("Processing file: %s", file_path)
 
                         # Calculate the transform and metadata for the target CRS
                         transform, width, height = calculate_default_transform(
@@ -388,33 +909,44 @@ class SceneOperations:
                             "width": width,
                             "height": height,
                         })
+                        # Tiled, compressed output, compressed with the file's share of the threads
+                        meta.update(GEOTIFF_PROFILE, predictor=geotiff_predictor(meta["dtype"]), num_threads=warp_threads)
 
                         # Create the output file path with "_reprojected" suffix
                         file_name, file_extension = os.path.splitext(os.path.basename(file_path))
                         output_file = os.path.join(output_folder, f"{file_name}_reprojected{file_extension}")
-                        os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-                        # Perform reprojection
+                        # Bit flag QA bands are masks, so their values are never interpolated
+                        is_qa = _is_bit_flag_band(file_path)
+
+                        # Perform reprojection of all bands in a single warp operation, file to file
+                        # (GDAL warps chunk by chunk, so the rasters are never fully loaded in memory;
+                        # rasterio evaluates the coordinate transformation with GDAL's approximate transformer)
+                        bands = list(range(1, src.count + 1))
                         with rasterio.open(output_file, "w", **meta) as dst:
-                            for i in range(1, src.count + 1):
-                                reproject(
-                                    source=rasterio.band(src, i),
-                                    destination=rasterio.band(dst, i),
-                                    src_transform=src.transform,
-                                    src_crs=src.crs,
-                                    dst_transform=transform,
-                                    dst_crs=target_crs,
-                                    resampling=Resampling.nearest,
-                                )
-
-                        print(f"File reprojected and saved to: {output_file}")
+                            reproject(
+                                source=rasterio.band(src, bands),
+                                destination=rasterio.band(dst, bands),
+                                src_transform=src.transform,
+                                src_crs=src.crs,
+                                dst_transform=transform,
+                                dst_crs=target_crs,
+                                resampling=qa_resampling if is_qa else resampling,
+                                num_threads=warp_threads,
+                                warp_mem_limit=warp_mem_limit,
+                            )
+
+                        logger.debug("File reprojected and saved to: %s", output_file)
 
                 except rasterio.errors.RasterioIOError as rio_err:
-                    print(f"RasterioIOError for file {file_path}: {rio_err}")
+                    logger.error("RasterioIOError for file %s: %s", file_path, rio_err)
                 except Exception as e:
-                    print(f"Error reprojecting file {file_path}: {e}")
+                    logger.error("Error reprojecting file %s: %s", file_path, e)
+
+            with ThreadPoolExecutor(max_workers=file_workers) as executor:
+                list(executor.map(reproject_file, raster_files))
 
-            print(f"Reprojection complete for scene: {scene_id}.")
+            logger.info("Reprojection complete for scene: %s.", scene_id)
 
         except Exception as e:
-            print(f"Unexpected error while reprojecting scene {scene_id}: {e}")
\ No newline at end of file
+            logger.error("Unexpected error while reprojecting scene %s: %s", scene_id, e)
\ No newline at end of file
@@ -1,4 +1,10 @@
 import os
+import logging
+import datetime
+from contextlib import contextmanager
+import numpy as np
+
+logger = logging.getLogger(__name__)
 
 # Constants
 """
@@ -7,13 +13,90 @@ Stores all constant values used across the library.
 
 DEFAULT_CRS = "EPSG:4326"  # Default Coordinate Reference System
 SUPPORTED_INDICES = ["NDVI", "NDBI", "NDWI", "SAVI"]  # List of supported indices
-DEFAULT_RESAMPLING_METHOD = "nearest"  # Default resampling method for reprojection
+DEFAULT_RESAMPLING_METHOD = "bilinear"  # Default resampling method for reprojecting continuous bands
+QA_RESAMPLING_METHOD = "nearest"  # QA bands hold bit flags, which must not be interpolated
+# Band suffixes of the QA bands holding bit flags (Landsat 4-9); ST_QA holds continuous uncertainty values
+QA_BIT_FLAG_BANDS = ("QA_PIXEL", "QA_RADSAT", "SR_QA_AEROSOL", "SR_CLOUD_QA")
+
+# Creation options for written GeoTIFFs: 512x512 internal tiles with multithreaded DEFLATE compression
+GEOTIFF_PROFILE = {
+    "tiled": True,
+    "blockxsize": 512,
+    "blockysize": 512,
+    "compress": "deflate",
+    "BIGTIFF": "IF_SAFER",
+    "num_threads": "all_cpus",
+}
+
+# GDAL configuration for opening band files: GDAL otherwise lists the whole (often large)
+# scene folder on every open to look for sidecar files, which Landsat band files do not use
+GDAL_READ_OPTIONS = {"GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR"}
+
+# Scale factor of indices quantized to int16 (stored value * scale = index value)
+INDEX_SCALE_FACTOR = 0.0001
+INDEX_NODATA = -32768  # Nodata value of quantized int16 indices
+
+# Satellite type of each supported sensor code (Landsat file names start with the sensor code)
+SATELLITE_PREFIXES = {"le07": "landsat7", "lc08": "landsat8", "lc09": "landsat9"}
+
+# Surface reflectance band numbers for each supported satellite
+BAND_MAPPING = {
+    "landsat7": {"blue": 1, "green": 2, "red": 3, "nir": 4, "swir1": 5, "swir2": 7},
+    "landsat8": {"blue": 2, "green": 3, "red": 4, "nir": 5, "swir1": 6, "swir2": 7},
+    "landsat9": {"blue": 2, "green": 3, "red": 4, "nir": 5, "swir1": 6, "swir2": 7},
+}
+
+# Numerator and denominator bands used by each supported index
+INDEX_BANDS = {
+    "NDVI": ("nir", "red"),
+    "NDWI": ("green", "nir"),
+    "NDBI": ("swir1", "nir"),
+    "SAVI": ("nir", "red"),
+}
 
 # Helper Functions
 """
 Provides utility functions used across the library.
 """
 
+def geotiff_predictor(dtype):
+    """
+    Returns the GeoTIFF compression predictor suited to a data type.
+
+    Args:
+        dtype (str or np.dtype): Data type of the raster.
+
+    Returns:
+        int: 3 (floating point predictor) for floating point data, 2 (horizontal differencing) otherwise.
+    """
+    return 3 if np.dtype(dtype).kind == "f" else 2
+
+@contextmanager
+def atomic_output(output_file):
+    """
+    Yields a temporary path to write an output file to, moved onto `output_file` only if the block succeeds.
+
+    The temporary file is created in the output's folder (so the move is an atomic rename) and removed
+    if the block raises, so an interrupted or failed write never leaves a partial file under the final
+    name (which a later run with `skip_existing` would take as up to date).
+
+    Args:
+        output_file (str): Final path of the output file.
+
+    Yields:
+        str: Temporary path to write the output to.
+    """
+    # Hidden, and named per process so concurrent runs do not write to the same temporary file
+    folder, file_name = os.path.split(output_file)
+    temp_file = os.path.join(folder, f".{file_name}.{os.getpid()}.partial")
+    try:
+        yield temp_file
+    except BaseException:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+    os.replace(temp_file, output_file)
+
 def create_output_folder(base_folder_name):
     """
     Creates an output folder with a timestamp in its name.
@@ -28,11 +111,24 @@ def create_output_folder(base_folder_name):
         folder_name = f"{base_folder_name}"
         folder_path = os.path.join(os.getcwd(), folder_name)
         os.makedirs(folder_path, exist_ok=True)
-        print(f"Output folder created: {folder_path}")
+        logger.info("Output folder created: %s", folder_path)
         return folder_path
     except PermissionError:
-        print(f"Permission denied while creating folder: {folder_name}")
+        logger.error("Permission denied while creating folder: %s", folder_name)
         raise
     except Exception as e:
-        print(f"Error creating output folder '{base_folder_name}': {e}")
-        raise
\ No newline at end of file
+        logger.error("Error creating output folder '%s': %s", base_folder_name, e)
+        raise
+
+def default_output_folder(prefix):
+    """
+    Creates a timestamped default output folder (e.g., "output_indices_20240716_120000").
+
+    Args:
+        prefix (str): Folder name prefix (e.g., "output_indices").
+
+    Returns:
+        str: Path to the created folder.
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    return create_output_folder(f"{prefix}_{timestamp}")
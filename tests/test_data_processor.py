@@ -1,10 +1,38 @@
 import unittest
 import os
+import logging
 import shutil
+import tempfile
+from unittest import mock
 import numpy as np
-from LandsatToolkit.data_processor import SatelliteDataProcessor
+import rasterio
+from rasterio.transform import from_origin
+from LandsatToolkit.data_processor import SatelliteDataProcessor, _merge_scene_bands, _process_scene_indices
+from LandsatToolkit.scene_tools import SceneOperations
 from LandsatToolkit.utils import create_output_folder
 
+SCENE_ID = "LC08_L2SP_192029_20240716_20240722_02_T1"
+
+
+def write_band(file_path, value):
+    """Write a small single-band GeoTIFF filled with a value for the tests."""
+    with rasterio.open(
+        file_path, "w", driver="GTiff", height=2, width=2, count=1, dtype="uint16",
+        crs="EPSG:32632", transform=from_origin(500000, 5000000, 30, 30),
+    ) as dst:
+        dst.write(np.full((2, 2), value, dtype=np.uint16), 1)
+
+
+def record_pid(folder, sid):
+    """Scene worker for the tests: write the ID of the process running it to a file named after the scene."""
+    with open(os.path.join(folder, sid), "w") as f:
+        f.write(str(os.getpid()))
+
+
+def log_scene(sid):
+    """Scene worker for the tests: log a record through the package's logger."""
+    logging.getLogger("LandsatToolkit.data_processor").warning("Processed scene %s", sid)
+
 
 class TestSatelliteDataProcessor(unittest.TestCase):
     def setUp(self):
@@ -83,6 +111,117 @@ class TestSatelliteDataProcessor(unittest.TestCase):
 
         np.testing.assert_array_equal(result, processed_array)
 
+    def _scene_folder(self, band_values):
+        """Create a temporary scene folder with one band file per suffix, filled with its value."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        scene_files = []
+        for suffix, value in band_values.items():
+            file_path = os.path.join(folder, f"{SCENE_ID}_{suffix}.TIF")
+            write_band(file_path, value)
+            scene_files.append(file_path)
+        return folder, scene_files
+
+    def test_merge_scene_bands_selection(self):
+        """Test that merged bands are matched whole (B1 is not B10) and kept in the requested order."""
+        folder, scene_files = self._scene_folder({"SR_B1": 1, "SR_B2": 2, "ST_B10": 10})
+
+        _merge_scene_bands(SCENE_ID, scene_files, ["B10", "B1"], folder)
+        with rasterio.open(os.path.join(folder, f"{SCENE_ID}_merged.tif")) as src:
+            np.testing.assert_array_equal(src.read()[:, 0, 0], [10, 1])
+
+    def test_merge_scene_bands_skip_existing(self):
+        """Test that an up-to-date merged raster is kept, and rewritten once a band is newer."""
+        folder, scene_files = self._scene_folder({"SR_B1": 1, "SR_B2": 2})
+        output_file = os.path.join(folder, f"{SCENE_ID}_merged.tif")
+
+        _merge_scene_bands(SCENE_ID, scene_files, None, folder, skip_existing=True)
+        mtime = os.stat(output_file).st_mtime_ns
+        _merge_scene_bands(SCENE_ID, scene_files, None, folder, skip_existing=True)
+        self.assertEqual(os.stat(output_file).st_mtime_ns, mtime)
+
+        os.utime(scene_files[0], ns=(mtime + 10**9, mtime + 10**9))
+        _merge_scene_bands(SCENE_ID, scene_files, None, folder, skip_existing=True)
+        self.assertNotEqual(os.stat(output_file).st_mtime_ns, mtime)
+
+    def test_process_scene_indices_skip_existing(self):
+        """Test that indices newer than their bands are not recalculated."""
+        folder, scene_files = self._scene_folder({"SR_B4": 100, "SR_B5": 300})
+        band_index = {"SR_B4": scene_files[0], "SR_B5": scene_files[1]}
+        output_file = os.path.join(folder, SCENE_ID, "NDVI.tif")
+
+        args = (folder, SCENE_ID, scene_files, band_index, "landsat8", ["NDVI"], folder, 0.5, False)
+        _process_scene_indices(*args, skip_existing=True)
+        mtime = os.stat(output_file).st_mtime_ns
+        _process_scene_indices(*args, skip_existing=True)
+        self.assertEqual(os.stat(output_file).st_mtime_ns, mtime)
+
+    def test_failed_tile_leaves_no_output(self):
+        """Test that a failed tile leaves no output behind, so a rerun with skip_existing rebuilds it."""
+        folder, scene_files = self._scene_folder({"SR_B4": 100, "SR_B5": 300})
+        band_index = {"SR_B4": scene_files[0], "SR_B5": scene_files[1]}
+        index_file = os.path.join(folder, SCENE_ID, "NDVI.tif")
+        merged_file = os.path.join(folder, f"{SCENE_ID}_merged.tif")
+
+        args = (folder, SCENE_ID, scene_files, band_index, "landsat8", ["NDVI"], folder, 0.5, False)
+        with mock.patch.object(SceneOperations, "read_band", side_effect=OSError("tile read failed")):
+            _process_scene_indices(*args, skip_existing=True)
+        with mock.patch.object(rasterio.io.DatasetReader, "read", side_effect=OSError("tile read failed")):
+            _merge_scene_bands(SCENE_ID, scene_files, None, folder, skip_existing=True)
+        self.assertFalse(os.path.exists(index_file))
+        self.assertFalse(os.path.exists(merged_file))
+        self.assertEqual([f for f in os.listdir(folder) if f.endswith(".partial")], [])
+
+        _process_scene_indices(*args, skip_existing=True)
+        _merge_scene_bands(SCENE_ID, scene_files, None, folder, skip_existing=True)
+        with rasterio.open(index_file) as src:
+            np.testing.assert_allclose(src.read(1), 0.5)
+        with rasterio.open(merged_file) as src:
+            np.testing.assert_array_equal(src.read()[:, 0, 0], [100, 300])
+
+    def test_indice_calculator_unsupported_index(self):
+        """Test that an unsupported index is skipped without stopping the supported ones."""
+        folder, _ = self._scene_folder({"SR_B4": 100, "SR_B5": 300})
+        output_folder = os.path.join(folder, "indices")
+
+        SatelliteDataProcessor(input_folder=folder).indice_calculator(output_folder, indices=["EVI", "NDVI"])
+        self.assertEqual(os.listdir(os.path.join(output_folder, SCENE_ID)), ["NDVI.tif"])
+
+    def test_indice_calculator_without_b4(self):
+        """Test that indices whose bands are present are calculated when SR_B4 is missing."""
+        folder, _ = self._scene_folder({"SR_B3": 200, "SR_B5": 300})
+        output_folder = os.path.join(folder, "indices")
+
+        SatelliteDataProcessor(input_folder=folder).indice_calculator(output_folder, indices=["NDVI", "NDWI"])
+        self.assertEqual(os.listdir(os.path.join(output_folder, SCENE_ID)), ["NDWI.tif"])
+        with rasterio.open(os.path.join(output_folder, SCENE_ID, "NDWI.tif")) as src:
+            np.testing.assert_allclose(src.read(1), -0.2)
+
+    def test_run_scenes_worker_processes(self):
+        """Test that scenes run in worker processes only when more than one worker is requested."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+
+        def worker_pids(max_workers):
+            self.processor._run_scenes(record_pid, {sid: (folder, sid) for sid in ["a", "b"]}, max_workers)
+            pids = set()
+            for sid in ["a", "b"]:
+                with open(os.path.join(folder, sid)) as f:
+                    pids.add(int(f.read()))
+            return pids
+
+        self.assertEqual(worker_pids(1), {os.getpid()})
+        self.assertNotIn(os.getpid(), worker_pids(2))
+
+    def test_run_scenes_forwards_worker_logs(self):
+        """Test that log records of worker processes reach the parent process's handlers."""
+        with self.assertLogs("LandsatToolkit", level="WARNING") as logs:
+            self.processor._run_scenes(log_scene, {sid: (sid,) for sid in ["a", "b"]}, max_workers=2)
+
+        messages = sorted(record.getMessage() for record in logs.records)
+        self.assertEqual(messages, ["Processed scene a", "Processed scene b"])
+        self.assertNotIn(os.getpid(), {record.process for record in logs.records})
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
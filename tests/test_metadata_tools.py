@@ -1,6 +1,9 @@
 import unittest
 import os
+import shutil
+import tempfile
 from LandsatToolkit.metadata_tools import MetadataManager
+from LandsatToolkit.scene_tools import SceneOperations
 
 
 class TestMetadataManager(unittest.TestCase):
@@ -85,6 +88,43 @@ class TestMetadataManager(unittest.TestCase):
         result = self.metadata_manager.format_metadata()
         self.assertEqual(result, formatted_metadata)
 
+    def test_parse_metadata(self):
+        """Test parsing an MTL file into grouped key-value pairs."""
+        mtl_path = "test_MTL.txt"
+        with open(mtl_path, "w") as f:
+            f.write(
+                "GROUP = LANDSAT_METADATA_FILE\n"
+                "  GROUP = PRODUCT_CONTENTS\n"
+                '    LANDSAT_PRODUCT_ID = "LC08_L2SP_192029_20240716_20240722_02_T1"\n'
+                "    COLLECTION_NUMBER = 02\n"
+                "  END_GROUP = PRODUCT_CONTENTS\n"
+                "END_GROUP = LANDSAT_METADATA_FILE\n"
+                "END\n"
+            )
+
+        try:
+            metadata = self.metadata_manager._parse_metadata(mtl_path)
+        finally:
+            os.remove(mtl_path)
+
+        self.assertEqual(metadata["LANDSAT_METADATA_FILE"], {})
+        self.assertEqual(
+            metadata["PRODUCT_CONTENTS"],
+            {"LANDSAT_PRODUCT_ID": "LC08_L2SP_192029_20240716_20240722_02_T1", "COLLECTION_NUMBER": "02"},
+        )
+
+    def test_group_files_by_scene_matches_scene_tools(self):
+        """Test that metadata files are grouped under the same scene IDs as by SceneOperations."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        for file_name in ["LC08_L2SP_192029_20240716_20240722_02_T1_MTL.txt", "LC08_L2SP_192029_MTL.txt"]:
+            with open(os.path.join(folder, file_name), "w") as f:
+                f.write("END\n")
+
+        scenes = self.metadata_manager._group_files_by_scene(folder)
+        self.assertEqual(scenes.keys(), SceneOperations(input_folder=folder).group_files_by_scene().keys())
+        self.assertIn("LC08_L2SP_192029_20240716_20240722_02_T1", scenes)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
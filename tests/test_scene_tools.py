@@ -1,6 +1,25 @@
 import unittest
 import os
-from LandsatToolkit.scene_tools import SceneOperations
+import shutil
+import tempfile
+from unittest import mock
+import numpy as np
+import rasterio
+import rasterio.warp
+from rasterio.enums import Resampling
+from rasterio.transform import from_origin
+from LandsatToolkit.scene_tools import SceneOperations, _is_bit_flag_band, _satellite_type_from_name, _scene_id_from_name
+
+SCENE_ID = "LC08_L2SP_192029_20240716_20240722_02_T1"
+
+
+def write_band(file_path, data, nodata=None):
+    """Write a small single-band GeoTIFF for the tests."""
+    with rasterio.open(
+        file_path, "w", driver="GTiff", height=data.shape[0], width=data.shape[1], count=1,
+        dtype=data.dtype, crs="EPSG:32632", transform=from_origin(500000, 5000000, 30, 30), nodata=nodata,
+    ) as dst:
+        dst.write(data, 1)
 
 
 class TestSceneOperations(unittest.TestCase):
@@ -96,6 +115,270 @@ class TestSceneOperations(unittest.TestCase):
         result = self.scene_ops.calculate_scene_statistics(self.scene_files[0])
         self.assertDictEqual(result, statistics)
 
+    def test_group_files_by_scene_cache(self):
+        """Test that scene grouping is cached until the input folder changes."""
+        first = self.scene_ops.group_files_by_scene()
+        self.assertIs(self.scene_ops.group_files_by_scene(), first)
+
+        scene_file = os.path.join(self.scene_folder, "LC08_L2SP_192029_20240716_20240722_02_T1_SR_B4.TIF")
+        open(scene_file, "w").close()
+        self.scene_files.append(scene_file)
+        os.utime(self.scene_folder, ns=(0, 0))  # Force a different folder mtime
+
+        scenes = self.scene_ops.group_files_by_scene()
+        self.assertIn("LC08_L2SP_192029_20240716_20240722_02_T1", scenes)
+
+        self.scene_ops.invalidate_cache()
+        self.assertIsNot(self.scene_ops.group_files_by_scene(), scenes)
+
+    def test_normalized_difference(self):
+        """Test the normalized difference on UInt16 bands, including zero denominators."""
+        matrix = np.array([[[300, 0]], [[100, 0]]], dtype=np.uint16)
+        index = self.scene_ops.normalized_difference(matrix, 1, 0, "NDVI")
+        self.assertEqual(index.dtype, np.float32)
+        np.testing.assert_allclose(index, [[-0.5, 0.0]])
+
+    def test_index_band_files(self):
+        """Test mapping band suffixes of scene files to their paths."""
+        prefix = "LC08_L2SP_192029_20240716_20240722_02_T1"
+        files = [f"{prefix}_SR_B4.TIF", f"{prefix}_ST_B10.TIF", f"{prefix}_QA_PIXEL.TIF", f"{prefix}_MTL.txt"]
+        band_index = self.scene_ops.index_band_files(files)
+        self.assertEqual(band_index, {"SR_B4": files[0], "ST_B10": files[1], "QA_PIXEL": files[2]})
+
+    def test_create_band_matrices_unreadable_band(self):
+        """Test that a requested band that cannot be read fails instead of shifting the stack."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        write_band(os.path.join(folder, f"{SCENE_ID}_SR_B5.TIF"), np.full((2, 2), 5, dtype=np.uint16))
+        write_band(os.path.join(folder, f"{SCENE_ID}_SR_B3.TIF"), np.full((2, 2), 3, dtype=np.uint16))
+        with open(os.path.join(folder, f"{SCENE_ID}_SR_B4.TIF"), "w") as f:
+            f.write("not a raster")
+        scene_ops = SceneOperations(input_folder=folder)
+
+        matrix = scene_ops.create_band_matrices(SCENE_ID, ["nir", "green"])
+        np.testing.assert_array_equal(matrix[:, 0, 0], [5, 3])
+        self.assertIsNone(scene_ops.create_band_matrices(SCENE_ID, ["nir", "red", "green"]))
+
+    def test_create_band_matrices_memmap_cleanup(self):
+        """Test that a memory-mapped stack with an unreadable band leaves no file behind."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        write_band(os.path.join(folder, f"{SCENE_ID}_SR_B1.TIF"), np.full((2, 2), 1, dtype=np.uint16))
+        with open(os.path.join(folder, f"{SCENE_ID}_SR_B2.TIF"), "w") as f:
+            f.write("not a raster")
+        memmap_file = os.path.join(folder, "stack.npy")
+
+        self.assertIsNone(SceneOperations(input_folder=folder).create_band_matrices(SCENE_ID, memmap_file=memmap_file))
+        self.assertFalse(os.path.exists(memmap_file))
+
+    def test_band_stack(self):
+        """Test that the temporary memory-mapped stack is removed on exit."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        write_band(os.path.join(folder, f"{SCENE_ID}_SR_B5.TIF"), np.full((2, 2), 5, dtype=np.uint16))
+        write_band(os.path.join(folder, f"{SCENE_ID}_SR_B4.TIF"), np.full((2, 2), 4, dtype=np.uint16))
+        scene_ops = SceneOperations(input_folder=folder)
+
+        with scene_ops.band_stack(SCENE_ID, ["nir", "red"], temp_dir=folder) as matrix:
+            self.assertIsInstance(matrix, np.memmap)
+            np.testing.assert_array_equal(matrix[:, 0, 0], [5, 4])
+            memmap_file = matrix.filename
+        self.assertFalse(os.path.exists(memmap_file))
+
+        with self.assertRaises(ValueError):
+            with scene_ops.band_stack(SCENE_ID, ["nir", "swir1"], temp_dir=folder):
+                pass
+        self.assertEqual(len(os.listdir(folder)), 2)
+
+    def test_is_bit_flag_band(self):
+        """Test which QA bands are resampled as bit flags."""
+        for suffix in ["QA_PIXEL", "QA_RADSAT", "SR_QA_AEROSOL"]:
+            self.assertTrue(_is_bit_flag_band(f"/data/{SCENE_ID}_{suffix}.TIF"))
+        self.assertTrue(_is_bit_flag_band("LE07_L2SP_192029_20200716_20200811_02_T1_SR_CLOUD_QA.TIF"))
+        for suffix in ["ST_QA", "SR_B4", "ST_B10"]:
+            self.assertFalse(_is_bit_flag_band(f"{SCENE_ID}_{suffix}.TIF"))
+
+    def test_calculate_and_save_indices_quantize(self):
+        """Test that quantized indices are saved as scaled int16, with nodata where there is no index."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        band_files = {"nir": os.path.join(folder, f"{SCENE_ID}_SR_B5.TIF"), "red": os.path.join(folder, f"{SCENE_ID}_SR_B4.TIF")}
+        write_band(band_files["nir"], np.array([[300, 0, 200], [100, 200, 50]], dtype=np.uint16))
+        write_band(band_files["red"], np.array([[100, 0, 200], [300, 7, 50]], dtype=np.uint16), nodata=7)
+        output_file = os.path.join(folder, "NDVI.tif")
+
+        SceneOperations(input_folder=folder).calculate_and_save_indices(band_files, {"NDVI": output_file}, "landsat8", quantize=True)
+        with rasterio.open(output_file) as src:
+            self.assertEqual(src.dtypes[0], "int16")
+            self.assertEqual(src.scales, (0.0001,))
+            self.assertEqual(src.nodata, -32768)
+            # A zero denominator and the red band's nodata give nodata; equal bands give a valid 0
+            np.testing.assert_array_equal(src.read(1), [[5000, -32768, 0], [-5000, -32768, 0]])
+
+    def test_organize_satellite_data_link_or_copy(self):
+        """Test that organized files are hard-linked when possible and copied otherwise."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        input_folder = os.path.join(folder, "input")
+        os.makedirs(input_folder)
+        file_name = f"{SCENE_ID}_MTL.txt"
+        with open(os.path.join(input_folder, file_name), "w") as f:
+            f.write("metadata")
+        scene_ops = SceneOperations(input_folder=input_folder)
+
+        linked = os.path.join(folder, "linked", "LANDSAT8", SCENE_ID, file_name)
+        scene_ops.organize_satellite_data(os.path.join(folder, "linked"))
+        self.assertTrue(os.path.samefile(os.path.join(input_folder, file_name), linked))
+        # Organizing again onto the existing link keeps the input intact
+        scene_ops.organize_satellite_data(os.path.join(folder, "linked"))
+        with open(os.path.join(input_folder, file_name)) as f:
+            self.assertEqual(f.read(), "metadata")
+
+        # Copied when linking is disabled, or fails (e.g., across file systems)
+        for output_name, link_when_possible in [("copied", False), ("fallback", True)]:
+            copied = os.path.join(folder, output_name, "LANDSAT8", SCENE_ID, file_name)
+            with mock.patch("os.link", side_effect=OSError("cross-device link")):
+                scene_ops.organize_satellite_data(os.path.join(folder, output_name), link_when_possible=link_when_possible)
+            self.assertFalse(os.path.samefile(os.path.join(input_folder, file_name), copied))
+            with open(copied) as f:
+                self.assertEqual(f.read(), "metadata")
+
+    def test_satellite_type_from_name(self):
+        """Test that the satellite type is read from the sensor code prefix only."""
+        self.assertEqual(_satellite_type_from_name(f"{SCENE_ID}_SR_B4.TIF"), "landsat8")
+        self.assertEqual(_satellite_type_from_name("le07_l2sp_192029_20200716_20200811_02_t1_SR_B3.TIF"), "landsat7")
+        self.assertEqual(_satellite_type_from_name("LC09"), "landsat9")
+        self.assertIsNone(_satellite_type_from_name("copy_of_LC08_L2SP_192029_SR_B4.TIF"))
+        self.assertIsNone(_satellite_type_from_name("LC8"))
+
+    def test_scene_id_from_name(self):
+        """Test that the scene ID is the part of the file name before its 7th underscore."""
+        names = [
+            f"{SCENE_ID}_SR_B4.TIF",
+            f"{SCENE_ID}_MTL.txt",
+            SCENE_ID,
+            "LC08_L2SP_192029",
+            "scene_0.tif",
+            "",
+        ]
+        for name in names:
+            self.assertEqual(_scene_id_from_name(name), "_".join(name.split("_")[:7]))
+
+    def test_create_band_matrices_scene_files(self):
+        """Test that already grouped scene files are stacked without scanning the input folder."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        scene_files = [os.path.join(folder, f"{SCENE_ID}_SR_B{band}.TIF") for band in (5, 4)]
+        for band, file_path in zip((5, 4), scene_files):
+            write_band(file_path, np.full((2, 2), band, dtype=np.uint16))
+
+        # The input folder holds none of the scene's files
+        matrix = self.scene_ops.create_band_matrices(SCENE_ID, ["nir", "red"], scene_files=scene_files)
+        np.testing.assert_array_equal(matrix[:, 0, 0], [5, 4])
+
+    def test_reproject_scene_resampling_member(self):
+        """Test that the resampling method can be given by name or as a Resampling member."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        scene_files = [os.path.join(folder, f"{SCENE_ID}_SR_B4.TIF")]
+        write_band(scene_files[0], np.arange(16, dtype=np.uint16).reshape(4, 4))
+
+        outputs = []
+        for resampling in ["bilinear", Resampling.bilinear]:
+            output_folder = os.path.join(folder, str(resampling))
+            self.scene_ops.reproject_scene(SCENE_ID, "EPSG:4326", output_folder, resampling=resampling,
+                                           num_threads=1, scene_files=scene_files)
+            with rasterio.open(os.path.join(output_folder, f"{SCENE_ID}_SR_B4_reprojected.TIF")) as src:
+                outputs.append(src.read())
+        np.testing.assert_array_equal(outputs[0], outputs[1])
+
+    def test_calculate_and_save_indices_tile_workers(self):
+        """Test that indices computed in several tile threads match the single-threaded result."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        rng = np.random.default_rng(0)
+        # Larger than one 512x512 tile in both directions, with partial edge tiles
+        nir, red = rng.integers(1, 10000, size=(2, 1100, 600), dtype=np.uint16)
+        band_files = {"nir": os.path.join(folder, f"{SCENE_ID}_SR_B5.TIF"), "red": os.path.join(folder, f"{SCENE_ID}_SR_B4.TIF")}
+        write_band(band_files["nir"], nir)
+        write_band(band_files["red"], red)
+
+        results = []
+        for tile_workers in [1, 3]:
+            output_files = {index: os.path.join(folder, f"{index}_{tile_workers}.tif") for index in ["NDVI", "SAVI"]}
+            self.scene_ops.calculate_and_save_indices(band_files, output_files, "landsat8", tile_workers=tile_workers)
+            with rasterio.open(output_files["NDVI"]) as ndvi, rasterio.open(output_files["SAVI"]) as savi:
+                results.append((ndvi.read(1), savi.read(1)))
+
+        np.testing.assert_array_equal(results[0][0], results[1][0])
+        np.testing.assert_array_equal(results[0][1], results[1][1])
+        nir, red = nir.astype(np.float32), red.astype(np.float32)
+        np.testing.assert_allclose(results[1][0], (nir - red) / (nir + red), atol=1e-6)
+
+    def test_reproject_scene_qa_resampling(self):
+        """Test that bit flag QA bands are reprojected with nearest while other bands are interpolated."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        flags = np.random.default_rng(0).choice(np.array([1, 64, 256], dtype=np.uint16), size=(20, 20))
+        suffixes = ["QA_PIXEL", "SR_B4", "ST_QA"]
+        scene_files = [os.path.join(folder, f"{SCENE_ID}_{suffix}.TIF") for suffix in suffixes]
+        for file_path in scene_files:
+            write_band(file_path, flags)
+
+        output_folder = os.path.join(folder, "reprojected")
+        self.scene_ops.reproject_scene(SCENE_ID, "EPSG:4326", output_folder, resampling="bilinear",
+                                       num_threads=2, scene_files=scene_files)
+        values = {}
+        for suffix in suffixes:
+            with rasterio.open(os.path.join(output_folder, f"{SCENE_ID}_{suffix}_reprojected.TIF")) as src:
+                values[suffix] = set(np.unique(src.read(1)))
+
+        self.assertLessEqual(values["QA_PIXEL"], {0, 1, 64, 256})
+        self.assertTrue(values["SR_B4"] - {0, 1, 64, 256})
+        self.assertTrue(values["ST_QA"] - {0, 1, 64, 256})
+
+    def test_reproject_scene_warp_threads(self):
+        """Test that the thread budget is split between the files warped concurrently."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        scene_files = [os.path.join(folder, f"{SCENE_ID}_SR_B{band}.TIF") for band in (4, 5)]
+        for band, file_path in enumerate(scene_files):
+            write_band(file_path, np.full((4, 4), band + 1, dtype=np.uint16))
+
+        output_folder = os.path.join(folder, "reprojected")
+        with mock.patch("rasterio.warp.reproject", wraps=rasterio.warp.reproject) as warp, \
+                mock.patch("rasterio.open", wraps=rasterio.open) as open_raster:
+            self.scene_ops.reproject_scene(SCENE_ID, "EPSG:4326", output_folder, num_threads=4, scene_files=scene_files)
+
+        # Two files warped at once get two threads each, for warping and for compressing their output
+        self.assertEqual([call.kwargs["num_threads"] for call in warp.call_args_list], [2, 2])
+        writes = [call for call in open_raster.call_args_list if call.args[1:2] == ("w",)]
+        self.assertEqual([call.kwargs["num_threads"] for call in writes], [2, 2])
+        for file_path in scene_files:
+            file_name, extension = os.path.splitext(os.path.basename(file_path))
+            self.assertTrue(os.path.exists(os.path.join(output_folder, f"{file_name}_reprojected{extension}")))
+
+    def test_files_for_scene(self):
+        """Test looking up a single scene's files, with and without the cached grouping."""
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        other_scene = "LC08_L2SP_192029_20240716_20240722_02_T2"
+        names = [f"{SCENE_ID}_SR_B4.TIF", f"{SCENE_ID}_MTL.txt", f"{SCENE_ID}X_SR_B4.TIF", f"{other_scene}_SR_B4.TIF"]
+        for name in names:
+            with open(os.path.join(folder, name), "w") as f:
+                f.write("dummy")
+        os.makedirs(os.path.join(folder, f"{SCENE_ID}_extra"))
+        scene_ops = SceneOperations(input_folder=folder)
+        expected = sorted(os.path.join(folder, name) for name in names[:2])
+
+        # Only the scene's own files, not those of a scene whose ID starts the same, nor folders
+        self.assertEqual(scene_ops._files_for_scene(SCENE_ID), expected)
+        self.assertEqual(scene_ops._files_for_scene("LC09_L2SP_192029_20240716_20240722_02_T1"), [])
+
+        # The cached grouping, once built, gives the same files
+        scene_ops.group_files_by_scene()
+        self.assertEqual(sorted(scene_ops._files_for_scene(SCENE_ID)), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file